@@ -2,15 +2,18 @@ import os
 import shutil
 import math
 import random
+from array import array
+from bisect import bisect_right
 import numpy as np
 import librosa
 from proglog import ProgressBarLogger
 from moviepy.editor import VideoFileClip, ImageClip, AudioFileClip, VideoClip, CompositeVideoClip, afx, concatenate_audioclips, ColorClip
 from moviepy.editor import TextClip
 from moviepy.config import change_settings
-from moviepy.video.tools.subtitles import SubtitlesClip, file_to_subtitles
+from moviepy.video.tools.subtitles import SubtitlesClip
 from PIL import Image, ImageDraw, ImageFont
 from functools import lru_cache
+from lyrics import read_lyrics_file
 
 # Robust ImageMagick Configuration
 def configure_imagemagick():
@@ -471,35 +474,12 @@ def run_render(config, logger_cb):
             return tc
         
         subs = []
-        if l_path.lower().endswith('.srt'):
-            try:
-                subs = file_to_subtitles(l_path)
-            except Exception as e:
-                print(f"SRT Parse Error: {e}")
-        elif l_path.lower().endswith('.lrc'):
-            try:
-                with open(l_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                parsed = []
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('[') and ']' in line:
-                        idx = line.find(']')
-                        time_str = line[1:idx]
-                        content = line[idx+1:].strip()
-                        parts = time_str.split(':')
-                        if len(parts) == 2:
-                            sec = float(parts[0])*60 + float(parts[1])
-                            parsed.append((sec, content))
-                for i in range(len(parsed)):
-                    s, t = parsed[i]
-                    if not t: continue
-                    e = parsed[i+1][0] if i < len(parsed)-1 else dur
-                    e = min(e, dur)
-                    if s < dur:
-                        subs.append(((s, e), t))
-            except Exception as e:
-                print(f"LRC Parse Error: {e}")
+        try:
+            # Same parser as the live preview (mmap scan for .lrc, streamed cues for .srt),
+            # clipped to the render length
+            subs = [((s, min(e, dur)), t) for (s, e), t in read_lyrics_file(l_path, last_end=dur) if s < dur]
+        except Exception as e:
+            print(f"Lyrics Parse Error: {e}")
 
         if subs:
             # Global Fixed Background Box Logic
@@ -535,23 +515,20 @@ def run_render(config, logger_cb):
 
                 line_spacing = int(l_fontsize * 1.5)
                 
-                # Pre-calculate timings for virtual index
-                timings = []
-                for i in range(len(subs)):
-                    s, e = subs[i][0]
-                    next_s = subs[i+1][0][0] if i < len(subs)-1 else e + 5.0
-                    timings.append((s, e, next_s))
+                # Pre-calculate timings for virtual index; starts are searched per frame
+                sub_starts = array('d', (s for (s, e), _ in subs))
+                sub_ends = array('d', (e for (s, e), _ in subs))
 
                 def get_v_idx(t):
-                    for i, (s, e, next_s) in enumerate(timings):
-                        if s <= t <= e:
-                            # Scroll continuously during the line
-                            return i + (t - s) / (e - s)
-                        if e < t < next_s:
-                            # During gap, hold position at the start of the next line
-                            return float(i + 1)
-                    if timings and t >= timings[-1][1]: return float(len(timings))
-                    return -1.0
+                    # Binary search for the last line that has started
+                    i = bisect_right(sub_starts, t) - 1
+                    if i < 0: return -1.0
+                    s, e = sub_starts[i], sub_ends[i]
+                    if t <= e:
+                        # Scroll continuously during the line
+                        return i + ((t - s) / (e - s) if e > s else 0.0)
+                    # During gap, hold position at the start of the next line
+                    return float(i + 1)
 
                 scroll_clips = []
                 for i, ((s, e), txt) in enumerate(subs):
@@ -639,21 +616,21 @@ def run_render(config, logger_cb):
                     if total_weight == 0: total_weight = 1
                     
                     word_timings = []
+                    word_starts = []
                     curr_char = 0
                     for w in words:
                         w_len = len(w) + 1 # Include space
                         start_p = curr_char / total_weight
                         end_p = (curr_char + w_len) / total_weight
                         word_timings.append((start_p, end_p))
+                        word_starts.append(start_p)
                         curr_char += w_len
 
                     def past_mask_wipe(get_mask, t):
                         m = get_mask(t).copy()
                         prog = t / dur_chunk
                         
-                        idx = 0
-                        for i, (s, e) in enumerate(word_timings):
-                            if prog >= s: idx = i
+                        idx = max(bisect_right(word_starts, prog) - 1, 0)
                         
                         if idx == 0:
                             m[:] = 0
@@ -666,9 +643,7 @@ def run_render(config, logger_cb):
                         m = get_mask(t).copy()
                         prog = t / dur_chunk
                         
-                        idx = 0
-                        for i, (s, e) in enumerate(word_timings):
-                            if prog >= s: idx = i
+                        idx = max(bisect_right(word_starts, prog) - 1, 0)
                         
                         start_x = 0
                         if idx > 0:
@@ -0,0 +1,86 @@
+# Lyric file parsing shared by the live preview (main.py) and the renderer (engine.py)
+import os
+import mmap
+
+SRT_SUFFIX = '.srt'
+LRC_SUFFIX = '.lrc'
+
+def scan_lrc(buf):
+    # Single pass over a bytes-like buffer (e.g. an mmap): a leading run of [mm:ss(.xx)] tags,
+    # then the lyric. A line may carry several tags for a repeated lyric; tags like [ar:...]
+    # are skipped. Only the lyric text itself is decoded.
+    parsed = []
+    n = len(buf)
+    i = 3 if buf[:3] == b'\xef\xbb\xbf' else 0
+    while i < n:
+        eol = buf.find(b'\n', i)
+        if eol < 0:
+            eol = n
+        j = i
+        while j < eol and buf[j] in b' \t':
+            j += 1
+        times = []
+        while j < eol and buf[j] == 0x5b: # '['
+            close = buf.find(b']', j + 1, eol)
+            colon = buf.find(b':', j + 1, close) if close > 0 else -1
+            if colon < 0:
+                break
+            mm, ss = buf[j + 1:colon], buf[colon + 1:close]
+            if not mm.isdigit() or not ss.replace(b'.', b'', 1).isdigit():
+                break
+            try:
+                times.append(int(mm) * 60 + float(ss))
+            except ValueError:
+                break
+            j = close + 1
+        if times:
+            content = buf[j:eol].strip().decode('utf-8', 'replace')
+            parsed.extend((sec, content) for sec in times)
+        i = eol + 1
+    return parsed
+
+def srt_seconds(stamp):
+    # "HH:MM:SS,mmm" (optionally followed by position hints) -> seconds
+    h, m, sec = stamp.split()[0].replace(',', '.').split(':')
+    return int(h) * 3600 + int(m) * 60 + float(sec)
+
+def iter_srt(path):
+    # Streams ((start, end), text) cues through a buffered reader.
+    # Keeps a final cue with no trailing blank line and ignores stray blank lines.
+    times, text = None, []
+    with open(path, 'r', encoding='utf-8-sig', buffering=1 << 16) as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if '-->' in line:
+                start, _, end = line.partition('-->')
+                times, text = (srt_seconds(start), srt_seconds(end)), []
+            elif not line.strip():
+                if times is not None and text:
+                    yield times, '\n'.join(text)
+                times, text = None, []
+            elif times is not None:
+                text.append(line)
+    if times is not None and text:
+        yield times, '\n'.join(text)
+
+def read_lyrics_file(path, last_end=None):
+    # Returns [((start, end), text), ...] for .srt and .lrc files.
+    # The last LRC line has no successor: it ends at last_end (the renderer passes the video
+    # length) or, by default, 10 s after it starts.
+    ext = os.path.splitext(path)[1].lower()
+    if ext == SRT_SUFFIX:
+        return list(iter_srt(path))
+    parsed_lyrics = []
+    if ext == LRC_SUFFIX:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return parsed_lyrics
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                parsed = scan_lrc(mm)
+        parsed.sort(key=lambda p: p[0])
+        for (s, t), (e, _) in zip(parsed, parsed[1:] + [(None, None)]):
+            if not t: continue
+            if e is None:
+                e = last_end if last_end is not None else s + 10.0
+            parsed_lyrics.append(((s, e), t))
+    return parsed_lyrics
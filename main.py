@@ -5,37 +5,187 @@ import librosa
 import numpy as np
 import uuid
 import hashlib
+import hmac
 import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QProgressBar, QLabel, QCheckBox, QSpinBox, QAbstractSpinBox, QDoubleSpinBox,
                              QColorDialog, QLineEdit, QComboBox, QSlider, QFileDialog, QScrollArea, 
                              QGroupBox, QFrame, QMessageBox, QDialog, QListWidget, QListWidgetItem, QAbstractItemView)
 from PySide6.QtGui import QImage, QPixmap, QColor, QFontDatabase, QPainter, QFont, QDesktopServices, QFontMetrics, QPen, QPolygon, QPainterPath, QBrush, QIcon, QAction
-from PySide6.QtCore import QThread, Signal, Qt, QRect, QPoint, QUrl
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink
+from PySide6.QtCore import QThread, Signal, Qt, QRect, QPoint, QUrl, QObject, QRunnable, QThreadPool, QEvent
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink, QVideoFrame, QVideoFrameFormat
 from PySide6.QtCore import QTimer
 from interface import ControlPanel
 from engine import run_render, RenderLogger
-from moviepy.editor import VideoFileClip
-from moviepy.video.tools.subtitles import file_to_subtitles
+from lyrics import read_lyrics_file
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import rocket_fft # Lets numba compile np.fft calls
+except ImportError:
+    rocket_fft = None
 
 SECRET_SALT = "NoYa_Remaster_Secret_2024" # Must match the salt in admin_keygen.py
 
 APP_DATA_FILE = "sys_config.json"
 
+BTN_QSS_TPL = "background-color: {}; color: {};"
+
+# Position presets resolved by table lookup; "Custom" keeps the dragged position
+TEXT_POS_PRESETS = {"Center": (0.5, 0.5), "Top": (0.5, 0.1), "Bottom": (0.5, 0.9)}
+SPECTRUM_POS_PRESETS = {"Bottom": (0.5, 0.95), "Top": (0.5, 0.05), "Center": (0.5, 0.5)}
+LYRICS_POS_PRESETS = {"Top": (0.5, 0.1), "Center": (0.5, 0.5), "Bottom": (0.5, 0.8)}
+# Logo corner as (horizontal, vertical): -1 left/top, 0 center, 1 right/bottom
+LOGO_ANCHORS = {"Top Right": (1, -1), "Top Left": (-1, -1), "Bottom Right": (1, 1), "Bottom Left": (-1, 1), "Center": (0, 0)}
+RES_HEIGHTS = {"720p": 720, "1080p": 1080, "2K": 1440, "4K": 2160}
+
+FONT_CACHE_SIZE = 64
+FIT_CACHE_SIZE = 128
+
+# Some pseudo-random but consistent heights for a nice look when no audio is playing
+PREVIEW_SPECTRUM_HEIGHTS = np.array([0.1, 0.2, 0.35, 0.4, 0.5, 0.45, 0.3, 0.2, 0.15, 0.25, 0.3, 0.4, 0.5, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.15, 0.2, 0.3, 0.4, 0.3, 0.2, 0.25, 0.35, 0.45, 0.55, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.2, 0.3, 0.4, 0.3, 0.2, 0.1, 0.15, 0.25, 0.35, 0.45, 0.35, 0.25, 0.15, 0.1, 0.05])
+
+# Decoder outputs that share QImage.Format_RGB32's memory layout
+RGB32_FRAME_FORMATS = (QVideoFrameFormat.Format_BGRA8888, QVideoFrameFormat.Format_BGRX8888)
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.webp')
+VIDEO_EXTS = ('.mp4', '.mov', '.avi', '.mkv')
+
+SPECTRUM_CACHE_DIR = "cache"
+SPECTRUM_CACHE_VERSION = 3 # Bump when the analysis changes so stale caches are ignored
+ANALYSIS_SR = 22050
+SPECTRUM_MEMORY_CACHE_SIZE = 8 # Songs kept in RAM so playlist loops skip the worker entirely
+
+def read_json(path):
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.loads(f.read())
+
+def write_json(path, data, indent=False):
+    # Write next to the target and swap it in, so a crash never leaves a truncated file
+    tmp_path = path + ".tmp"
+    if orjson:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        # Serialize in one go; json.dump would issue a write per token
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2 if indent else None))
+    os.replace(tmp_path, path)
+
+def _ema_kernel(prev, raw, alpha, out):
+    for i in range(out.shape[0]):
+        out[i] = alpha * raw[i] + (1.0 - alpha) * prev[i]
+
+if njit is not None:
+    # Compiled eagerly for the one signature the preview uses (at import, or loaded from the
+    # on-disk cache), so the first smoothed frame never waits on the JIT during playback
+    ema = njit("void(float32[::1], float32[::1], float64, float32[::1])", cache=True, fastmath=True)(_ema_kernel)
+else:
+    _ema_scratch = [None] # Reused across frames; only the GUI thread smooths
+
+    def ema(prev, raw, alpha, out):
+        # Same blend as the kernel, in place through one preallocated buffer
+        tmp = _ema_scratch[0]
+        if tmp is None or tmp.shape != out.shape or tmp.dtype != out.dtype:
+            tmp = _ema_scratch[0] = np.empty_like(out)
+        np.multiply(raw, alpha, out=tmp)
+        if prev is not out:
+            np.copyto(out, prev)
+        out *= 1.0 - alpha
+        out += tmp
+
+def _stft_bars_kernel(y, n_fft, hop, window, bins_per_bar, out):
+    # Frame + window + rfft + bar averaging in one pass, without materializing the spectrogram
+    num_bars, n_frames = out.shape
+    for t in prange(n_frames):
+        frame = y[t * hop:t * hop + n_fft] * window
+        mag = np.abs(np.fft.rfft(frame))
+        for b in range(num_bars):
+            out[b, t] = mag[b * bins_per_bar:(b + 1) * bins_per_bar].mean()
+
+if njit is not None and rocket_fft is not None:
+    stft_bars = njit(parallel=True, cache=True)(_stft_bars_kernel)
+else:
+    stft_bars = None
+
+# numba's parallel runtime (workqueue layer) aborts on concurrent entry; a cancelled
+# SpectrumWorker can still be finishing a chunk when the next one starts
+_stft_lock = threading.Lock()
+
+def _existing_in_dir(folder, names):
+    if len(names) < 2:
+        return {n for n in names if os.path.exists(os.path.join(folder, n))}
+    # One directory listing answers every lookup in this folder
+    try:
+        with os.scandir(folder or ".") as it:
+            listed = {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+    found = {n for n in names if os.path.normcase(n) in listed}
+    # Anything the listing missed (e.g. case differences) gets a real stat
+    found.update(n for n in names if n not in found and os.path.exists(os.path.join(folder, n)))
+    return found
+
+def existing_paths(paths):
+    # Group by parent folder; folders are I/O bound (slow on network drives), so threads overlap them
+    groups = {}
+    for p in paths:
+        if p:
+            folder, name = os.path.split(p)
+            groups.setdefault(folder, {}).setdefault(name, []).append(p)
+    if not groups: return set()
+    workers = min(16, len(groups))
+    if workers < 2:
+        results = [_existing_in_dir(f, list(n)) for f, n in groups.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_existing_in_dir, groups.keys(), map(list, groups.values())))
+    # Hand back the caller's own strings so membership tests match exactly
+    return {p for names, found in zip(groups.values(), results) for n in found for p in names[n]}
+
+def license_key_matches(device_id, expiry_date_str, key_part):
+    # Key is the first 8 SHA-256 bytes as hex (see admin_keygen.py); compare raw bytes in constant time
+    if len(key_part) != 16: return False
+    try:
+        given = bytes.fromhex(key_part)
+    except ValueError:
+        return False
+    digest = hashlib.sha256(f"{device_id}|{expiry_date_str}|{SECRET_SALT}".encode()).digest()
+    return hmac.compare_digest(digest[:8], given)
+
+def parse_expiry(date_str):
+    # Fixed "YYYYMMDD" -> datetime at midnight; slicing avoids strptime and its _strptime import
+    if len(date_str) != 8 or not date_str.isdigit():
+        raise ValueError(f"invalid expiry date: {date_str!r}")
+    return datetime.datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+
 def load_sys_data():
     if os.path.exists(APP_DATA_FILE):
         try:
-            with open(APP_DATA_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(APP_DATA_FILE)
         except:
             return {}
     return {}
 
 def save_sys_data(data):
     try:
-        with open(APP_DATA_FILE, 'w') as f:
-            json.dump(data, f)
+        write_json(APP_DATA_FILE, data)
     except:
         pass
 
@@ -54,34 +204,166 @@ class Worker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
-class SpectrumWorker(QThread):
-    finished = Signal(object)
-    def __init__(self, audio_path, fps=30, num_bars=50):
+class SpectrumWorkerSignals(QObject):
+    finished = Signal(object) # (frames, bars), frame-major; may be a read-only memmap
+    partial = Signal(int, object, int) # (frame offset, (bars, frames) chunk, total frames)
+
+class SpectrumWorker(QRunnable):
+    # Runs on the shared thread pool; cancel() stops it at the next chunk boundary
+    def __init__(self, audio_path, fps=30, num_bars=50, chunk_seconds=2):
         super().__init__()
+        self.signals = SpectrumWorkerSignals()
+        self._cancelled = threading.Event()
         self.audio_path = audio_path
         self.fps = fps
         self.num_bars = num_bars
+        self.chunk_frames = max(1, int(fps * chunk_seconds))
+
+    def cache_path(self):
+        # Cheap content key: first MiB + file size + analysis parameters (no need for a crypto hash)
+        with open(self.audio_path, 'rb') as f:
+            head = f.read(1 << 20)
+        params = f"{SPECTRUM_CACHE_VERSION}-{self.fps}-{self.num_bars}-{os.path.getsize(self.audio_path)}"
+        key = hashlib.blake2b(head + params.encode(), digest_size=16).hexdigest()
+        return os.path.join(SPECTRUM_CACHE_DIR, f"spectrum_{key}.npy")
+
+    def cancel(self):
+        self._cancelled.set()
+
     def run(self):
         try:
-            y, sr = librosa.load(self.audio_path, sr=None)
-            hop_length = int(sr / self.fps)
-            stft = np.abs(librosa.stft(y, n_fft=2048, hop_length=hop_length))
-            relevant_bins = int(3000 / (sr / 2048)) 
-            bins_per_bar = max(1, relevant_bins // self.num_bars)
-            bar_heights_list = []
-            for i in range(self.num_bars):
-                start_bin = i * bins_per_bar
-                end_bin = (i + 1) * bins_per_bar
-                bar_heights_list.append(np.mean(stft[start_bin:end_bin, :], axis=0))
-            self.finished.emit(np.array(bar_heights_list))
+            cache_path = self.cache_path()
+            if os.path.exists(cache_path):
+                try:
+                    # Memory-mapped: rows are paged in as playback reaches them
+                    self.signals.finished.emit(np.load(cache_path, mmap_mode='r'))
+                    return
+                except (OSError, ValueError) as e:
+                    print(f"Spectrum cache unreadable, recomputing: {e}")
+
+            bars = self.analyze()
+            if bars is None:
+                return # Cancelled; a newer song has its own worker
+            # Saved in the frame-major layout the preview reads, so cache hits need no transpose
+            bars = np.ascontiguousarray(bars.T)
+            try:
+                os.makedirs(SPECTRUM_CACHE_DIR, exist_ok=True)
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, bars)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Could not write spectrum cache: {e}")
+            self.signals.finished.emit(bars)
         except Exception as e:
             print(f"Spectrum analysis failed: {e}")
-            self.finished.emit(None)
+            self.signals.finished.emit(None)
+
+    def analyze(self):
+        # 22.05 kHz keeps everything up to 11 kHz, well past the 3 kHz band we draw, at half the samples
+        y, sr = librosa.load(self.audio_path, sr=ANALYSIS_SR, mono=True, res_type="soxr_hq", dtype=np.float32)
+        # 1024 points still resolve the 0-3 kHz band we draw; half the FFT work of 2048
+        n_fft = 1024
+        hop_length = int(sr / self.fps)
+        relevant_bins = int(3000 / (sr / n_fft))
+        # Magnitudes grow with window length; keep heights on the 2048-point scale the preview is tuned for
+        mag_scale = 2048 / n_fft
+        bins_per_bar = max(1, relevant_bins // self.num_bars)
+        total_frames = 1 + len(y) // hop_length
+
+        try:
+            gpu_bars = self.gpu_bars(y, n_fft, hop_length, bins_per_bar, mag_scale)
+        except Exception as e:
+            print(f"GPU spectrum unavailable, using CPU: {e}")
+            gpu_bars = None
+        if gpu_bars is not None:
+            return gpu_bars
+
+        bars = np.zeros((self.num_bars, total_frames), dtype=np.float32)
+
+        # Periodic Hann, matching librosa.stft's default window
+        window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n_fft) / n_fft)).astype(np.float32)
+
+        # Same framing as a centered librosa.stft, but analyzed a chunk at a time
+        # so the preview gets bars long before the whole song is processed
+        y = np.pad(y, n_fft // 2)
+        for f0 in range(0, total_frames, self.chunk_frames):
+            if self._cancelled.is_set():
+                return None
+            f1 = min(total_frames, f0 + self.chunk_frames)
+            seg = y[f0 * hop_length:(f1 - 1) * hop_length + n_fft]
+            if stft_bars is not None:
+                chunk = np.empty((self.num_bars, f1 - f0), dtype=np.float32)
+                with _stft_lock:
+                    stft_bars(seg, n_fft, hop_length, window, bins_per_bar, chunk)
+                bars[:, f0:f1] = chunk * mag_scale
+            else:
+                stft = np.abs(librosa.stft(seg, n_fft=n_fft, hop_length=hop_length, window=window, center=False, dtype=np.complex64))
+                # Average each run of bins_per_bar rows into one bar in a single pass
+                stft = stft[:bins_per_bar * self.num_bars]
+                bars[:, f0:f1] = stft.reshape(self.num_bars, bins_per_bar, -1).mean(axis=1) * mag_scale
+            self.signals.partial.emit(f0, bars[:, f0:f1].copy(), total_frames)
+        return bars
+
+    def gpu_bars(self, y, n_fft, hop_length, bins_per_bar, mag_scale):
+        # Optional CUDA path; torch is imported lazily so it never slows down startup
+        try:
+            import torch
+        except ImportError:
+            return None
+        if not torch.cuda.is_available():
+            return None
+        with torch.no_grad():
+            yt = torch.from_numpy(y).to("cuda")
+            window = torch.hann_window(n_fft, device="cuda")
+            spec = torch.stft(yt, n_fft=n_fft, hop_length=hop_length, window=window,
+                              center=True, pad_mode="constant", return_complex=True).abs()
+            spec = spec[:bins_per_bar * self.num_bars]
+            bars = spec.reshape(self.num_bars, bins_per_bar, -1).mean(dim=1) * mag_scale
+            return bars.cpu().numpy()
+
+class AudioEngine(QObject):
+    position_changed = Signal(int)
+    duration_changed = Signal(int)
+    media_status_changed = Signal(object)
+    def __init__(self):
+        super().__init__()
+        self.player = self.output = None
+        self.source_path = None
+    def setup(self):
+        # Runs on the audio thread (from QThread.started) so the backend is created there
+        # Unparented: shutdown() drops the last references, freeing them on this same thread
+        self.player = QMediaPlayer()
+        self.output = QAudioOutput()
+        self.output.setVolume(1.0)
+        self.player.setAudioOutput(self.output)
+        self.player.positionChanged.connect(self.position_changed)
+        self.player.durationChanged.connect(self.duration_changed)
+        self.player.mediaStatusChanged.connect(self.media_status_changed)
+    def play(self, path, loops=1):
+        # Replaying the loaded file just rewinds; setSource would rebuild the decoder
+        if path != self.source_path:
+            self.player.setSource(QUrl.fromLocalFile(path))
+            self.source_path = path
+        else:
+            self.player.setPosition(0)
+        self.player.setLoops(loops)
+        self.player.play()
+    def stop(self):
+        if self.player is not None:
+            self.player.stop()
+    def shutdown(self):
+        self.stop()
+        self.player = self.output = None
+
+class AudioThread(QThread):
+    # Hosts the AudioEngine's event loop so UI work on the GUI thread can't starve playback
+    play_requested = Signal(str, int) # (path, loops)
+    stop_requested = Signal()
 
 def get_machine_id():
     mac_num = uuid.getnode()
-    mac_hex = hex(mac_num)[2:].zfill(12).upper()
-    mac_address = ':'.join(mac_hex[i:i+2] for i in range(0, 12, 2))
+    mac_address = ':'.join(f'{(mac_num >> (8 * i)) & 0xff:02X}' for i in range(5, -1, -1))
     return mac_address
 
 class LicenseDialog(QDialog):
@@ -130,17 +412,13 @@ class LicenseDialog(QDialog):
         full_license = self.key_field.text().strip().upper()
         device_id = self.machine_id_field.text()
 
-        if "-" not in full_license or len(full_license.split('-')) != 2:
+        expiry_date_str, sep, user_key = full_license.partition('-')
+        if not sep or '-' in user_key:
             QMessageBox.warning(self, "Invalid Format", "The license key format is incorrect. It should be in the format 'YYYYMMDD-KEY'.")
             return
 
-        expiry_date_str, user_key = full_license.split('-')
-
         # 1. Verify the key against the device ID and expiry date
-        data_to_hash = f"{device_id}|{expiry_date_str}|{SECRET_SALT}"
-        expected_key = hashlib.sha256(data_to_hash.encode()).hexdigest()[:16].upper()
-
-        if user_key != expected_key:
+        if not license_key_matches(device_id, expiry_date_str, user_key):
             QMessageBox.warning(self, "Invalid License", "The license key is not valid for this machine.")
             return
         
@@ -154,7 +432,7 @@ class LicenseDialog(QDialog):
         # 2. Check if the license has expired (unless it's permanent)
         if expiry_date_str != "99991231":
             try:
-                expiry_date = datetime.datetime.strptime(expiry_date_str, "%Y%m%d")
+                expiry_date = parse_expiry(expiry_date_str)
                 if datetime.datetime.now() > expiry_date:
                     QMessageBox.warning(self, "License Expired", f"Your license expired on {expiry_date.strftime('%Y-%m-%d')}.")
                     return
@@ -201,7 +479,10 @@ class DraggableLabel(QLabel):
         self.logo_pixmap = None
         self.logo_size = 15
         self.logo_pos = "Top Right"
+        self._logo_anchor = LOGO_ANCHORS["Top Right"]
         self.live_heights = None
+        self._live_heights_mean = 0.0
+        self._live_heights_scaled = None
         self.progressbar_enabled = False
         self.live_progress = 0.0
         self.progressbar_color = QColor("#2ecc71")
@@ -217,16 +498,48 @@ class DraggableLabel(QLabel):
         self.lyrics_karaoke_enabled = False
         self.lyrics_progress = 0.0
         self.lyrics_scrolling_enabled = False
-        self.full_lyrics = []
+        self.lyric_starts = np.empty(0)
+        self.lyric_ends = np.empty(0)
+        self.lyric_texts = []
         self.current_time = 0.0
         self.current_audio_name = "None"
         self.current_lyrics_name = "None"
         self.lyrics_bg_dim = False
         self.lyrics_box_enabled = False
         self.lyrics_box_color = QColor(0, 0, 0, 128)
+        self._overlay_cache = {}
+        self._overlay_path_cache = (None, None)
+        self._overlay_content = None
+        self._is_dragging = False
+        self._line_cache = (None, None)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.update)
+        self._logo_path = None
+        self._scaled_cache = (None, 0, 0, None, False)
+        self._scaled_logo_cache = (None, 0, None)
+        self._font_cache = OrderedDict()
+        self._fit_cache = OrderedDict()
+        self._word_widths_key = None
+        self._word_widths_cache = None
+        self._info_font = QFont("Segoe UI", 9, QFont.Bold)
+
+    def schedule_update(self):
+        # Coalesce back-to-back setter calls into one repaint per frame budget
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def set_pixmap(self, pixmap):
         self.base_pixmap = pixmap
+        self._scaled_cache = (None, 0, 0, None, False)
+        self.schedule_update()
+
+    def set_status_text(self, text):
+        # paintEvent only falls back to QLabel text when there is no frame, so drop the old one
+        self.base_pixmap = None
+        self._scaled_cache = (None, 0, 0, None, False)
+        self.setText(text)
         self.update()
 
     def set_overlay_settings(self, text, font_family, font_size, color, target_height, shadow=False, 
@@ -240,7 +553,14 @@ class DraggableLabel(QLabel):
         self.overlay_border_width = border_width
         self.overlay_shadow = shadow
         self.target_height = target_height
-        self.update()
+        # Only what the text raster looks like invalidates it; position is applied at blit time,
+        # so position-only updates (preset box changes, drags) keep the cached layer
+        content = (text, font_family, font_size, color.rgba(), target_height, shadow,
+                   border_enabled, self.overlay_border_color.rgba(), border_width)
+        if content != self._overlay_content:
+            self._overlay_content = content
+            self._overlay_cache.pop("text", None)
+        self.schedule_update()
 
     def set_spectrum_preview(self, enabled, color, style, size, pos_str, thickness, sensitivity):
         self.spectrum_preview_enabled = enabled
@@ -251,35 +571,60 @@ class DraggableLabel(QLabel):
         self.spectrum_sensitivity = sensitivity
         if pos_str != "Custom":
             self.update_spectrum_pos_from_str(pos_str)
-        self.update()
+        self.schedule_update()
 
     def update_spectrum_pos_from_str(self, pos_str):
-        if pos_str == "Bottom": self.spectrum_rel_pos = [0.5, 0.95]
-        elif pos_str == "Top": self.spectrum_rel_pos = [0.5, 0.05]
-        elif pos_str == "Center": self.spectrum_rel_pos = [0.5, 0.5]
+        pos = SPECTRUM_POS_PRESETS.get(pos_str)
+        if pos: self.spectrum_rel_pos = list(pos)
 
     def set_logo_settings(self, path, size, pos):
-        if path and os.path.exists(path):
-            self.logo_pixmap = QPixmap(path)
-        else:
-            self.logo_pixmap = None
+        # Size/position tweaks reuse the decoded logo; only a new path hits the disk
+        if path != self._logo_path or self.logo_pixmap is None:
+            if path and os.path.exists(path):
+                self.logo_pixmap = QPixmap(path)
+            else:
+                self.logo_pixmap = None
+            self._logo_path = path
+            self._scaled_logo_cache = (None, 0, None)
         self.logo_size = size
         self.logo_pos = pos
-        self.update()
+        self._logo_anchor = LOGO_ANCHORS.get(pos, (0, 0))
+        self.schedule_update()
+
+    def set_frame_state(self, state):
+        # One playback tick's worth of changes, applied together so a paint never sees half of them
+        if not state:
+            return
+        if 'live_heights' in state:
+            self._store_live_heights(state.pop('live_heights'))
+        self.__dict__.update(state)
+        self.schedule_update()
 
     def set_live_heights(self, heights):
+        self._store_live_heights(heights)
+        self.schedule_update()
+
+    def _store_live_heights(self, heights):
         self.live_heights = heights
-        self.update()
+        self._live_heights_mean = float(np.mean(heights)) if heights is not None and len(heights) > 0 else 0.0
+        if heights is not None:
+            # Scale live data to match engine.py visual logic
+            # engine.py uses: raw * 15 * (size/50)
+            # Paint multiplies by sensitivity and max_h, which accounts for size. We approximate pixel height relative to 1080p.
+            self._live_heights_scaled = np.asarray(heights, dtype=np.float32) * (6.0 / 270.0)
 
     def set_live_progress(self, progress):
+        if progress == self.live_progress:
+            return
         self.live_progress = progress
+        self.schedule_update()
 
     def set_progressbar_settings(self, enabled, color, height, pos):
         self.progressbar_enabled = enabled
         self.progressbar_color = color
         self.progressbar_height = height
         self.progressbar_pos = pos
-        self.update()
+        self.schedule_update()
 
     def set_lyrics_settings(self, enabled, font, size, color, pos_str, bounce=False, karaoke=False, scrolling=False, bg_dim=False, box_enabled=False, box_color=None):
         self.lyrics_enabled = enabled
@@ -292,16 +637,193 @@ class DraggableLabel(QLabel):
         self.lyrics_bg_dim = bg_dim
         self.lyrics_box_enabled = box_enabled
         if box_color: self.lyrics_box_color = box_color
-        if pos_str != "Custom":
-            if pos_str == "Top": self.lyrics_rel_pos = [0.5, 0.1]
-            elif pos_str == "Center": self.lyrics_rel_pos = [0.5, 0.5]
-            elif pos_str == "Bottom": self.lyrics_rel_pos = [0.5, 0.8]
-        self.update()
+        pos = LYRICS_POS_PRESETS.get(pos_str)
+        if pos: self.lyrics_rel_pos = list(pos)
+        self.schedule_update()
+
+    def set_full_lyrics(self, starts, ends, texts):
+        # Parallel arrays from MainWindow; shared, not copied
+        self.lyric_starts = starts
+        self.lyric_ends = ends
+        self.lyric_texts = texts
+
+    def active_lyric(self, t):
+        # Index of the line being sung at t, or -1 between/outside lines
+        i = int(np.searchsorted(self.lyric_starts, t, side='right')) - 1
+        if i >= 0 and t <= self.lyric_ends[i]:
+            return i
+        return -1
 
     def set_media_info(self, audio_name, lyrics_name):
+        if (audio_name, lyrics_name) == (self.current_audio_name, self.current_lyrics_name):
+            return # Playlist looped back to the same song
         self.current_audio_name = audio_name
         self.current_lyrics_name = lyrics_name
-        self.update()
+        self._overlay_cache.pop("info", None)
+        self.schedule_update()
+
+    def _font(self, family, px):
+        # QFont/QFontMetrics construction does a font lookup, so keep a small LRU of them
+        key = (family, px)
+        entry = self._font_cache.get(key)
+        if entry is None:
+            font = QFont(family)
+            font.setPixelSize(px)
+            entry = (font, QFontMetrics(font))
+            self._font_cache[key] = entry
+            if len(self._font_cache) > FONT_CACHE_SIZE:
+                self._font_cache.popitem(last=False)
+        else:
+            self._font_cache.move_to_end(key)
+        return entry
+
+    def _fit_font(self, text, px, max_w):
+        # Auto-scale font if too wide; the measurement only depends on text, font and width
+        key = (text, self.lyrics_font_family, px, max_w)
+        entry = self._fit_cache.get(key)
+        if entry is None:
+            entry = self._font(self.lyrics_font_family, px)
+            txt_w = entry[1].horizontalAdvance(text)
+            if txt_w > max_w and txt_w > 0:
+                entry = self._font(self.lyrics_font_family, max(1, int(px * max_w / txt_w)))
+            self._fit_cache[key] = entry
+            if len(self._fit_cache) > FIT_CACHE_SIZE:
+                self._fit_cache.popitem(last=False)
+        else:
+            self._fit_cache.move_to_end(key)
+        return entry
+
+    def _word_widths(self, words, font, fm):
+        # (cumulative "word " advances, bare word advances), rebuilt only when the line or its font changes.
+        # The cumulative run places each word; the bare width sizes its highlight without the trailing space.
+        key = (self.lyrics_text, font.family(), font.pixelSize())
+        if self._word_widths_key != key:
+            self._word_widths_cache = (np.cumsum([fm.horizontalAdvance(w + " ") for w in words]),
+                                       [fm.horizontalAdvance(w) for w in words])
+            self._word_widths_key = key
+        return self._word_widths_cache
+
+    def _cached_layer(self, name, key, size, draw):
+        # Static overlays are rasterized once at their own bounding size and blitted until their
+        # inputs change. Position is applied by the caller at blit time, so moving reuses the raster.
+        dpr = self.devicePixelRatioF()
+        key = key + (dpr,)
+        cached = self._overlay_cache.get(name)
+        if cached is None or cached[0] != key:
+            w, h = size()
+            pix = QPixmap(max(1, int(w * dpr)), max(1, int(h * dpr)))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            layer_painter = QPainter(pix)
+            layer_painter.setRenderHint(QPainter.Antialiasing)
+            draw(layer_painter, w, h)
+            layer_painter.end()
+            cached = (key, pix, w, h)
+            self._overlay_cache[name] = cached
+        return cached[1:]
+
+    def _draw_logo(self, painter):
+        # Calculate size relative to video height (percentage)
+        target_h = max(1, int(self.image_rect.height() * (self.logo_size / 100)))
+        if self._scaled_logo_cache[:2] == (id(self.logo_pixmap), target_h):
+            scaled_logo = self._scaled_logo_cache[2]
+        else:
+            scaled_logo = self.logo_pixmap.scaledToHeight(target_h, Qt.SmoothTransformation)
+            self._scaled_logo_cache = (id(self.logo_pixmap), target_h, scaled_logo)
+
+        margin = int(self.image_rect.height() * 0.02) # 2% margin
+        lx, ly = 0, 0
+
+        ax, ay = self._logo_anchor
+
+        # Vertical Position
+        if ay < 0:
+            ly = self.image_rect.top() + margin
+        elif ay > 0:
+            ly = self.image_rect.bottom() - scaled_logo.height() - margin
+        else: 
+            ly = self.image_rect.center().y() - scaled_logo.height() // 2
+
+        # Horizontal Position
+        if ax < 0:
+            lx = self.image_rect.left() + margin
+        elif ax > 0:
+            lx = self.image_rect.right() - scaled_logo.width() - margin
+        else: 
+            lx = self.image_rect.center().x() - scaled_logo.width() // 2
+
+        painter.drawPixmap(lx, ly, scaled_logo)
+
+    def _overlay_text_font(self):
+        scale_factor = self.image_rect.height() / self.target_height
+        font, fm = self._font(self.overlay_font_family, max(1, int(self.overlay_font_size * scale_factor)))
+        return font, fm, scale_factor
+
+    def _overlay_text_size(self):
+        # Text box plus room for the shadow offset and border stroke on every side
+        font, fm, scale_factor = self._overlay_text_font()
+        b_rect = fm.boundingRect(self.overlay_text)
+        pad = 2
+        if self.overlay_shadow:
+            pad += max(1, int(self.overlay_font_size * scale_factor * 0.05))
+        if self.overlay_border_enabled:
+            pad += int(max(1, self.overlay_border_width * scale_factor)) + 1
+        return b_rect.width() + 20 + 2 * pad, b_rect.height() + 20 + 2 * pad
+
+    def _draw_overlay_text(self, painter, w, h):
+        # Drawn centered in a layer of size (w, h); paintEvent places the layer
+        font, fm, scale_factor = self._overlay_text_font()
+        painter.setFont(font)
+        painter.setPen(self.overlay_color)
+
+        cx, cy = w / 2, h / 2
+
+        b_rect = fm.boundingRect(self.overlay_text)
+        draw_rect = QRect(0, 0, b_rect.width() + 20, b_rect.height() + 20)
+        draw_rect.moveCenter(QPoint(int(cx), int(cy)))
+
+        if self.overlay_shadow:
+            shadow_offset = max(1, int(self.overlay_font_size * scale_factor * 0.05))
+            shadow_rect = draw_rect.translated(shadow_offset, shadow_offset)
+            painter.setPen(QColor(0, 0, 0, 180))
+            painter.drawText(shadow_rect, Qt.AlignCenter, self.overlay_text)
+
+        if self.overlay_border_enabled:
+            # Use QPainterPath for stroke/border; the outline is built at the origin once per font/text
+            path_key = (self.overlay_font_family, font.pixelSize(), self.overlay_text)
+            if self._overlay_path_cache[0] != path_key:
+                base_path = QPainterPath()
+                base_path.addText(QPoint(0, 0), font, self.overlay_text)
+                self._overlay_path_cache = (path_key, base_path)
+            # Calculate baseline origin to center text roughly where drawText would
+            text_w = fm.horizontalAdvance(self.overlay_text)
+            # Center X: cx - half width
+            # Center Y: cy + half ascent - half descent (approximate visual center)
+            origin_x = cx - text_w / 2
+            origin_y = cy + (fm.ascent() - fm.descent()) / 2
+            path = self._overlay_path_cache[1].translated(int(origin_x), int(origin_y))
+
+            pen = QPen(self.overlay_border_color)
+            # Scale border width for preview
+            pen.setWidthF(max(1, self.overlay_border_width * scale_factor))
+            painter.strokePath(path, pen)
+            painter.fillPath(path, QBrush(self.overlay_color))
+        else:
+            painter.drawText(draw_rect, Qt.AlignCenter, self.overlay_text)
+
+    def _media_info_text(self):
+        return f"🎵 {self.current_audio_name}\n📝 {self.current_lyrics_name}"
+
+    def _media_info_size(self):
+        rect = QFontMetrics(self._info_font).boundingRect(QRect(0, 0, self.width(), self.height()), Qt.AlignLeft | Qt.AlignTop, self._media_info_text())
+        return rect.width() + 10, rect.height() + 10
+
+    def _draw_media_info(self, painter, w, h):
+        painter.setFont(self._info_font)
+        rect = QRect(0, 0, w, h)
+        painter.fillRect(rect, QColor(0, 0, 0, 180))
+        painter.setPen(QColor(220, 220, 220))
+        painter.drawText(rect, Qt.AlignCenter, self._media_info_text())
 
     def paintEvent(self, event):
         if not self.base_pixmap:
@@ -312,7 +834,14 @@ class DraggableLabel(QLabel):
         painter.setRenderHint(QPainter.Antialiasing)
 
         w_lbl, h_lbl = self.width(), self.height()
-        scaled = self.base_pixmap.scaled(w_lbl, h_lbl, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Smooth rescaling of a full-size frame is the priciest step, so reuse it until the size changes.
+        # While dragging, new frames get a cheap nearest-neighbour scale; release redoes it smoothly.
+        if self._scaled_cache[:3] == (id(self.base_pixmap), w_lbl, h_lbl) and (self._scaled_cache[4] or self._is_dragging):
+            scaled = self._scaled_cache[3]
+        else:
+            mode = Qt.FastTransformation if self._is_dragging else Qt.SmoothTransformation
+            scaled = self.base_pixmap.scaled(w_lbl, h_lbl, Qt.KeepAspectRatio, mode)
+            self._scaled_cache = (id(self.base_pixmap), w_lbl, h_lbl, scaled, not self._is_dragging)
         
         x_off = (w_lbl - scaled.width()) // 2
         y_off = (h_lbl - scaled.height()) // 2
@@ -330,11 +859,11 @@ class DraggableLabel(QLabel):
             spec_w = int(scaled.width() * 0.8)
             bar_width = spec_w // num_bars
             
-            # Some pseudo-random but consistent heights for a nice look
+            # Normalized heights: live data (pre-scaled in set_live_heights) or the static sample
             if self.live_heights is not None:
-                heights = self.live_heights
+                heights = self._live_heights_scaled
             else:
-                heights = [0.1, 0.2, 0.35, 0.4, 0.5, 0.45, 0.3, 0.2, 0.15, 0.25, 0.3, 0.4, 0.5, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.15, 0.2, 0.3, 0.4, 0.3, 0.2, 0.25, 0.35, 0.45, 0.55, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.2, 0.3, 0.4, 0.3, 0.2, 0.1, 0.15, 0.25, 0.35, 0.45, 0.35, 0.25, 0.15, 0.1, 0.05]
+                heights = PREVIEW_SPECTRUM_HEIGHTS
             
             # Scale max height based on slider (1-100)
             max_h = int((scaled.height() / 2) * (self.spectrum_size / 100))
@@ -360,100 +889,72 @@ class DraggableLabel(QLabel):
             drawn_w = max(1, int(bar_width * (self.spectrum_thickness / 100.0)))
             offset = (bar_width - drawn_w) // 2
 
-            prev_point = None
-            filled_line_points = []
-
             sens_factor = self.spectrum_sensitivity / 100.0
 
-            for i in range(num_bars):
-                if self.live_heights is not None:
-                    # Scale live data to match engine.py visual logic
-                    # engine.py uses: raw * 15 * (size/50)
-                    # Here max_h accounts for size. We approximate pixel height relative to 1080p.
-                    bh = int(((heights[i] * sens_factor * 6) / 270.0) * max_h)
-                else:
-                    bh = int(heights[i] * sens_factor * max_h)
-                bx = start_x + i * bar_width + offset
-                
-                if self.spectrum_style == "Bars":
-                    # Check if position is "Top" (upper half of screen) to invert direction
-                    if self.spectrum_rel_pos[1] < 0.4:
-                        # Grow Down
-                        painter.drawRect(bx, int(cy), drawn_w, bh)
-                    else:
-                        # Grow Up
-                        painter.drawRect(bx, int(cy - bh), drawn_w, bh)
-                elif self.spectrum_style == "Blocks":
-                    block_h = max(2, int(max_h * 0.02)) # 2% of max height
-                    gap = max(1, int(block_h * 0.5))
-                    for b in range(0, bh, block_h + gap):
-                        if self.spectrum_rel_pos[1] < 0.4:
-                            painter.drawRect(bx, int(cy + b), drawn_w, block_h)
-                        else:
-                            painter.drawRect(bx, int(cy - b - block_h), drawn_w, block_h)
-                elif self.spectrum_style == "Line":
-                    center_x = bx + drawn_w // 2
-                    y = int(cy + bh) if self.spectrum_rel_pos[1] < 0.4 else int(cy - bh)
-                    curr_point = QPoint(center_x, y)
-                    if prev_point:
-                        painter.drawLine(prev_point, curr_point)
-                    prev_point = curr_point
-                elif self.spectrum_style == "Filled Line":
-                    center_x = bx + drawn_w // 2
-                    y = int(cy + bh) if self.spectrum_rel_pos[1] < 0.4 else int(cy - bh)
-                    filled_line_points.append(QPoint(center_x, y))
-                elif self.spectrum_style == "Mirrored":
+            # Vectorized prepass: bar heights and x positions for the whole spectrum at once
+            bhs = (heights[:num_bars] * (sens_factor * max_h)).astype(np.int32)
+            xs = start_x + np.arange(num_bars) * bar_width + offset
+            cy_i = int(cy)
+            # Check if position is "Top" (upper half of screen) to invert direction
+            grow_down = self.spectrum_rel_pos[1] < 0.4
+            style = self.spectrum_style
+
+            if style in ("Bars", "Mirrored", "Dots"):
+                if style == "Bars":
+                    ys = np.full(num_bars, cy_i) if grow_down else cy_i - bhs
+                    hs = bhs
+                elif style == "Mirrored":
                     # Grow Up and Down
-                    painter.drawRect(bx, int(cy - bh), drawn_w, bh * 2)
-                elif self.spectrum_style == "Dots":
+                    ys = cy_i - bhs
+                    hs = bhs * 2
+                else:
                     # Just the top
-                    painter.drawRect(bx, int(cy - bh), drawn_w, 4)
-                elif self.spectrum_style == "Circle":
-                    radius = 40 * (self.spectrum_size / 50.0)
-                    center = QPoint(int(cx), int(cy))
+                    ys = cy_i - bhs
+                    hs = np.full(num_bars, 4)
+                painter.drawRects([QRect(x, y, drawn_w, h) for x, y, h in zip(xs.tolist(), ys.tolist(), hs.tolist())])
+            elif style == "Blocks":
+                block_h = max(2, int(max_h * 0.02)) # 2% of max height
+                gap = max(1, int(block_h * 0.5))
+                rects = []
+                for bx, bh in zip(xs.tolist(), bhs.tolist()):
+                    for b in range(0, bh, block_h + gap):
+                        by = cy_i + b if grow_down else cy_i - b - block_h
+                        rects.append(QRect(bx, by, drawn_w, block_h))
+                if rects:
+                    painter.drawRects(rects)
+            elif style in ("Line", "Filled Line"):
+                # Only the y column changes frame to frame; x positions and the baseline are reused
+                line_key = (start_x, bar_width, offset, drawn_w, num_bars, cy_i)
+                if self._line_cache[0] != line_key:
+                    center_xs = xs + drawn_w // 2
+                    pts = np.empty((num_bars + 2, 2), dtype=np.int32)
+                    pts[:num_bars, 0] = center_xs
+                    # Close the polygon along the baseline
+                    pts[num_bars:] = ((center_xs[-1], cy_i), (center_xs[0], cy_i))
+                    self._line_cache = (line_key, pts)
+                pts = self._line_cache[1]
+                if grow_down:
+                    np.add(cy_i, bhs, out=pts[:num_bars, 1])
+                else:
+                    np.subtract(cy_i, bhs, out=pts[:num_bars, 1])
+                if style == "Line":
+                    painter.drawPolyline(QPolygon([QPoint(x, y) for x, y in pts[:num_bars].tolist()]))
+                else:
+                    painter.drawPolygon(QPolygon([QPoint(x, y) for x, y in pts.tolist()]))
+            elif style == "Circle":
+                radius = 40 * (self.spectrum_size / 50.0)
+                center = QPoint(int(cx), int(cy))
+                for i, bh in enumerate(bhs.tolist()):
                     painter.save()
                     painter.translate(center)
                     painter.rotate(i * (360.0 / num_bars))
                     # Draw bar extending outwards from radius
                     painter.drawRect(0, int(-radius - bh), drawn_w, bh)
                     painter.restore()
-            
-            if self.spectrum_style == "Filled Line" and filled_line_points:
-                # Close the polygon
-                base_y = int(cy)
-                first_x = filled_line_points[0].x()
-                last_x = filled_line_points[-1].x()
-                
-                polygon = QPolygon(filled_line_points)
-                polygon.append(QPoint(last_x, base_y))
-                polygon.append(QPoint(first_x, base_y))
-                painter.drawPolygon(polygon)
 
         if self.logo_pixmap and self.image_rect:
-            # Calculate size relative to video height (percentage)
-            target_h = max(1, int(self.image_rect.height() * (self.logo_size / 100)))
-            scaled_logo = self.logo_pixmap.scaledToHeight(target_h, Qt.SmoothTransformation)
-            
-            margin = int(self.image_rect.height() * 0.02) # 2% margin
-            lx, ly = 0, 0
-            
-            # Vertical Position
-            if "Top" in self.logo_pos: 
-                ly = self.image_rect.top() + margin
-            elif "Bottom" in self.logo_pos: 
-                ly = self.image_rect.bottom() - scaled_logo.height() - margin
-            else: 
-                ly = self.image_rect.center().y() - scaled_logo.height() // 2
-
-            # Horizontal Position
-            if "Left" in self.logo_pos: 
-                lx = self.image_rect.left() + margin
-            elif "Right" in self.logo_pos: 
-                lx = self.image_rect.right() - scaled_logo.width() - margin
-            else: 
-                lx = self.image_rect.center().x() - scaled_logo.width() // 2
-                
-            painter.drawPixmap(lx, ly, scaled_logo)
+            # The scaled logo is already its own small cached raster
+            self._draw_logo(painter)
 
         if self.progressbar_enabled and self.image_rect:
             bar_h = max(2, int(self.image_rect.height() * (self.progressbar_height / 100)))
@@ -467,12 +968,11 @@ class DraggableLabel(QLabel):
 
         if self.lyrics_enabled:
             l_scale = scaled.height() / self.target_height
-            l_font = QFont(self.lyrics_font_family)
             
             bounce_scale = 1.0
             if self.lyrics_bounce_enabled and self.live_heights is not None:
-                bounce_scale = 1.0 + min(0.3, np.mean(self.live_heights) * 0.05)
-            l_font.setPixelSize(max(1, int(self.lyrics_font_size * l_scale * bounce_scale)))
+                bounce_scale = 1.0 + min(0.3, self._live_heights_mean * 0.05)
+            l_px = max(1, int(self.lyrics_font_size * l_scale * bounce_scale))
             
             lx = x_off + (self.lyrics_rel_pos[0] * scaled.width())
             ly = y_off + (self.lyrics_rel_pos[1] * scaled.height())
@@ -486,34 +986,31 @@ class DraggableLabel(QLabel):
                 box_rect.moveCenter(QPoint(int(lx), int(ly)))
                 painter.fillRect(box_rect, self.lyrics_box_color)
             
-            if self.lyrics_scrolling_enabled and self.full_lyrics:
+            if self.lyrics_scrolling_enabled and self.lyric_texts:
                 # Smooth Scrolling Teleprompter Logic
                 line_height = int(self.lyrics_font_size * l_scale * 1.5)
                 
                 # Calculate Virtual Index for smooth scrolling
-                v_idx = float(len(self.full_lyrics)) # Default to end
-                found = False
-                for i, ((s, e), txt) in enumerate(self.full_lyrics):
-                    if s <= self.current_time <= e:
-                        # Scroll continuously during the line
-                        v_idx = i + (self.current_time - s) / (e - s)
-                        found = True
-                        break
-                    elif self.current_time < s:
-                        # Before this line (Gap)
-                        if i == 0: v_idx = -1.0
-                        else:
-                            # In gap, hold position at start of next line
-                            v_idx = float(i)
-                        found = True
-                        break
+                # Binary search for the last line that has started
+                t = self.current_time
+                i = int(np.searchsorted(self.lyric_starts, t, side='right')) - 1
+                if i >= 0 and t <= self.lyric_ends[i]:
+                    # Scroll continuously during the line
+                    s, e = self.lyric_starts[i], self.lyric_ends[i]
+                    v_idx = i + ((t - s) / (e - s) if e > s else 0.0)
+                elif i < 0:
+                    # Before the first line
+                    v_idx = -1.0
+                else:
+                    # In gap, hold position at start of next line (or the end)
+                    v_idx = float(i + 1)
 
                 center_y = ly
                 start_i = max(0, int(v_idx) - 2)
-                end_i = min(len(self.full_lyrics), int(v_idx) + 3)
+                end_i = min(len(self.lyric_texts), int(v_idx) + 3)
 
                 for i in range(start_i, end_i):
-                    ((s, e), txt) = self.full_lyrics[i]
+                    txt = self.lyric_texts[i]
                     dist = i - v_idx
                     draw_y = center_y + (dist * line_height)
                     
@@ -523,14 +1020,7 @@ class DraggableLabel(QLabel):
                     if opacity > 0.05:
                         c = self.lyrics_color
                         
-                        # Auto-scale font if too wide
-                        line_font = QFont(l_font)
-                        line_fm = QFontMetrics(line_font)
-                        txt_w = line_fm.horizontalAdvance(txt)
-                        if txt_w > max_w and txt_w > 0:
-                            factor = max_w / txt_w
-                            line_font.setPixelSize(max(1, int(line_font.pixelSize() * factor)))
-                            line_fm = QFontMetrics(line_font)
+                        line_font, line_fm = self._fit_font(txt, l_px, max_w)
 
                         painter.setFont(line_font)
                         painter.setPen(QColor(c.red(), c.green(), c.blue(), int(255 * opacity)))
@@ -542,14 +1032,7 @@ class DraggableLabel(QLabel):
                 return # Skip standard drawing
 
             # Standard / Karaoke Mode
-            # Auto-scale font if too wide
-            final_font = QFont(l_font)
-            final_fm = QFontMetrics(final_font)
-            txt_w = final_fm.horizontalAdvance(self.lyrics_text)
-            if txt_w > max_w and txt_w > 0:
-                factor = max_w / txt_w
-                final_font.setPixelSize(max(1, int(final_font.pixelSize() * factor)))
-                final_fm = QFontMetrics(final_font)
+            final_font, final_fm = self._fit_font(self.lyrics_text, l_px, max_w)
 
             painter.setFont(final_font)
             painter.setPen(self.lyrics_color)
@@ -583,12 +1066,13 @@ class DraggableLabel(QLabel):
                     
                     text_start_x = l_draw_rect.center().x() - (l_rect.width() / 2)
 
+                    word_offsets, word_widths = self._word_widths(words, final_font, l_fm)
+                    past_width = word_offsets[active_word_index - 1] if active_word_index > 0 else 0
+
                     # 1. Draw Past Words (Active Color)
                     if active_word_index > 0:
                         painter.setPen(self.lyrics_color)
                         painter.save()
-                        past_str = " ".join(words[:active_word_index]) + " "
-                        past_width = l_fm.horizontalAdvance(past_str)
                         painter.setClipRect(int(text_start_x), l_draw_rect.y(), int(past_width), l_draw_rect.height())
                         painter.drawText(l_draw_rect, Qt.AlignCenter, self.lyrics_text)
                         painter.restore()
@@ -597,12 +1081,8 @@ class DraggableLabel(QLabel):
                     painter.setPen(QColor("yellow"))
                     painter.save()
                     
-                    start_offset = 0
-                    if active_word_index > 0:
-                        past_str = " ".join(words[:active_word_index]) + " "
-                        start_offset = l_fm.horizontalAdvance(past_str)
-                    
-                    current_word_width = l_fm.horizontalAdvance(words[active_word_index])
+                    start_offset = past_width
+                    current_word_width = word_widths[active_word_index]
                     
                     painter.setClipRect(int(text_start_x + start_offset), l_draw_rect.y(), int(current_word_width + 5), l_draw_rect.height())
                     painter.drawText(l_draw_rect, Qt.AlignCenter, self.lyrics_text)
@@ -612,58 +1092,25 @@ class DraggableLabel(QLabel):
                 painter.drawText(l_draw_rect, Qt.AlignCenter, self.lyrics_text)
 
         if self.overlay_text:
-            scale_factor = scaled.height() / self.target_height
-            font = QFont(self.overlay_font_family)
-            font.setPixelSize(max(1, int(self.overlay_font_size * scale_factor)))
-            painter.setFont(font)
-            painter.setPen(self.overlay_color)
-            
-            cx = x_off + (self.rel_pos[0] * scaled.width())
-            cy = y_off + (self.rel_pos[1] * scaled.height())
-            
-            fm = QFontMetrics(font)
-            b_rect = fm.boundingRect(self.overlay_text)
-            draw_rect = QRect(0, 0, b_rect.width() + 20, b_rect.height() + 20)
-            draw_rect.moveCenter(QPoint(int(cx), int(cy)))
-            
-            if self.overlay_shadow:
-                shadow_offset = max(1, int(self.overlay_font_size * scale_factor * 0.05))
-                shadow_rect = draw_rect.translated(shadow_offset, shadow_offset)
-                painter.setPen(QColor(0, 0, 0, 180))
-                painter.drawText(shadow_rect, Qt.AlignCenter, self.overlay_text)
-            
-            if self.overlay_border_enabled:
-                # Use QPainterPath for stroke/border
-                path = QPainterPath()
-                # Calculate baseline origin to center text roughly where drawText would
-                text_w = fm.horizontalAdvance(self.overlay_text)
-                # Center X: cx - half width
-                # Center Y: cy + half ascent - half descent (approximate visual center)
-                origin_x = cx - text_w / 2
-                origin_y = cy + (fm.ascent() - fm.descent()) / 2
-                path.addText(QPoint(int(origin_x), int(origin_y)), font, self.overlay_text)
-                
-                pen = QPen(self.overlay_border_color)
-                # Scale border width for preview
-                pen.setWidthF(max(1, self.overlay_border_width * scale_factor))
-                painter.strokePath(path, pen)
-                painter.fillPath(path, QBrush(self.overlay_color))
-            else:
-                painter.drawText(draw_rect, Qt.AlignCenter, self.overlay_text)
+            pix, tw, th = self._cached_layer("text", (self.image_rect.height(),), self._overlay_text_size, self._draw_overlay_text)
+            cx = self.image_rect.x() + (self.rel_pos[0] * self.image_rect.width())
+            cy = self.image_rect.y() + (self.rel_pos[1] * self.image_rect.height())
+            painter.drawPixmap(int(cx - tw / 2), int(cy - th / 2), pix)
 
         # Draw Media Info Overlay (Top-Left)
         if self.current_audio_name != "None" or self.current_lyrics_name != "None":
-            info_text = f"🎵 {self.current_audio_name}\n📝 {self.current_lyrics_name}"
-            painter.setFont(QFont("Segoe UI", 9, QFont.Bold))
-            fm = painter.fontMetrics()
-            m = 10
-            rect = fm.boundingRect(QRect(0, 0, w_lbl, h_lbl), Qt.AlignLeft | Qt.AlignTop, info_text)
-            rect.adjust(-5, -5, 5, 5)
-            rect.moveTopLeft(QPoint(m, m))
-            
-            painter.fillRect(rect, QColor(0, 0, 0, 180))
-            painter.setPen(QColor(220, 220, 220))
-            painter.drawText(rect, Qt.AlignCenter, info_text)
+            pix, _, _ = self._cached_layer("info", (w_lbl, h_lbl), self._media_info_size, self._draw_media_info)
+            painter.drawPixmap(10, 10, pix)
+
+    def mousePressEvent(self, event):
+        self._is_dragging = True
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._is_dragging = False
+        # Repaint so a frame scaled fast during the drag is redone smoothly
+        self.update()
+        super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
         if self.image_rect:
@@ -689,24 +1136,96 @@ class DraggableLabel(QLabel):
             
             self.update()
 
+_FONT_FAMILIES = None
+
+def font_families():
+    # Platform font enumeration is slow; do it once per process and only when a picker needs it
+    global _FONT_FAMILIES
+    if _FONT_FAMILIES is None:
+        _FONT_FAMILIES = QFontDatabase.families()
+    return _FONT_FAMILIES
+
+class FontComboBox(QComboBox):
+    # Holds just the selected family until the user (or a preset) needs the full list
+    def __init__(self, current="Arial"):
+        super().__init__()
+        self.addItem(current)
+        self._populated = False
+
+    def _populate(self):
+        if self._populated:
+            return
+        self._populated = True
+        # Fill around the current entry so an installed selection (and currentText) never changes
+        current = self.currentText()
+        families = font_families()
+        if current in families:
+            idx = families.index(current)
+            self.insertItems(0, families[:idx])
+            self.addItems(families[idx + 1:])
+        elif families:
+            # Placeholder isn't installed: switch to the closest real family and drop it
+            folded = current.casefold()
+            idx = next((i for i, f in enumerate(families) if f.casefold() == folded), 0)
+            self.addItems(families)
+            self.setCurrentIndex(idx + 1)
+            self.removeItem(0)
+
+    def selected_family(self):
+        # The unpopulated placeholder may not be installed; resolve it before it reaches a preset or render
+        self._populate()
+        return self.currentText()
+
+    def showPopup(self):
+        self._populate()
+        super().showPopup()
+
+    def setCurrentText(self, text):
+        self._populate()
+        super().setCurrentText(text)
+
+    def keyPressEvent(self, event):
+        self._populate()
+        super().keyPressEvent(event)
+
+    def wheelEvent(self, event):
+        self._populate()
+        super().wheelEvent(event)
+
 class MainWindow(QMainWindow):
     def __init__(self, expiry_date_str=None):
         super().__init__()
         self.setWindowTitle("LoopMaster Pro")
         self.version = "1.0.0"
         self.setMinimumSize(900, 600)
+        self._btn_colors = {}
+        self._color_css_cache = {}
+        self._lyrics_box_qcolor_cache = (None, None)
+        self._last_lyrics_state = None
+        self._throttle_timers = {}
+        self._slider_labels = {}
         self.lyrics_path = ""
         self.lyrics_paths = []
-        self.parsed_lyrics = []
+        self._lyrics_paths_set = set() # O(1) dedup for lyrics_paths
+        self._lyrics_names = {} # path -> basename shown in the list
+        self.lyric_starts = np.empty(0)
+        self.lyric_ends = np.empty(0)
+        self.lyric_texts = []
+        self._lyric_cache = {} # path -> (mtime, parsed entries)
         self.current_output_path = ""
         self.logo_path = ""
         self.is_playing = False
         self.audio_queue = []
-        self.spectrum_data = None
+        self.spectrum_data = None # (frames, bars), frame-major
         self.spectrum_fps = 30
         self.current_smooth_heights = None
-        self.preview_timer = QTimer()
-        self.preview_timer.timeout.connect(self.update_playback_loop)
+        self.smooth_alpha = 1.0
+        self._ema_raw = None # Writable staging row for ema()
+        self._last_frame_idx = -1
+        self._last_prog = 0.0
+        self.spec_worker = None
+        self._audio_pos = None # (position ms, monotonic time) of the last player report
+        self._spectrum_cache = OrderedDict() # (song path, fps) -> bars, most recent last
 
         # Media Player Setup
         self.media_player = QMediaPlayer()
@@ -716,12 +1235,28 @@ class MainWindow(QMainWindow):
         self.video_sink = QVideoSink()
         self.media_player.setVideoSink(self.video_sink)
         self.video_sink.videoFrameChanged.connect(self.handle_video_frame)
-
-        self.music_player = QMediaPlayer()
-        self.music_output = QAudioOutput()
-        self.music_output.setVolume(1.0)
-        self.music_player.setAudioOutput(self.music_output)
-        self.music_player.mediaStatusChanged.connect(self.handle_music_status)
+        self.media_player.errorOccurred.connect(self.on_video_error)
+
+        self.current_song = ""
+        self.music_duration = 0
+        self.audio_thread = AudioThread()
+        self.audio_engine = AudioEngine()
+        self.audio_engine.moveToThread(self.audio_thread)
+        # Everything is wired before start(), so requests emitted early are queued, not dropped
+        self.audio_thread.started.connect(self.audio_engine.setup, Qt.DirectConnection)
+        self.audio_thread.finished.connect(self.audio_engine.shutdown, Qt.DirectConnection)
+        self.audio_thread.play_requested.connect(self.audio_engine.play, Qt.QueuedConnection)
+        self.audio_thread.stop_requested.connect(self.audio_engine.stop, Qt.QueuedConnection)
+        self.audio_engine.media_status_changed.connect(self.handle_music_status, Qt.QueuedConnection)
+        self.audio_engine.position_changed.connect(self.on_audio_position, Qt.QueuedConnection)
+        self.audio_engine.duration_changed.connect(self.on_music_duration, Qt.QueuedConnection)
+        QApplication.instance().aboutToQuit.connect(self.stop_audio_thread)
+        self.audio_thread.start()
+        # Backends throttle positionChanged (~50 ms+), so the preview runs on its own frame clock
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.setInterval(round(1000 / self.spectrum_fps))
+        self.frame_timer.timeout.connect(self.on_frame_tick)
         
         central = QWidget()
         self.setCentralWidget(central)
@@ -791,31 +1326,32 @@ class MainWindow(QMainWindow):
         self.spec_size_slider = QSlider(Qt.Horizontal)
         self.spec_size_slider.setRange(10, 150)
         self.spec_size_slider.setValue(50)
-        self.spec_size_slider.valueChanged.connect(lambda v: self.spec_size_label.setText(f"Size: {v}%"))
+        self._bind_value_label(self.spec_size_slider, self.spec_size_label, "Size: {}%")
         
         self.spec_thick_label = QLabel("Thickness: 80%")
         self.spec_thick_slider = QSlider(Qt.Horizontal)
         self.spec_thick_slider.setRange(10, 100)
         self.spec_thick_slider.setValue(80)
-        self.spec_thick_slider.valueChanged.connect(lambda v: self.spec_thick_label.setText(f"Thickness: {v}%"))
+        self._bind_value_label(self.spec_thick_slider, self.spec_thick_label, "Thickness: {}%")
         
         self.spec_smooth_label = QLabel("Smoothness: 0%")
         self.spec_smooth_slider = QSlider(Qt.Horizontal)
         self.spec_smooth_slider.setRange(0, 95)
         self.spec_smooth_slider.setValue(0)
-        self.spec_smooth_slider.valueChanged.connect(lambda v: self.spec_smooth_label.setText(f"Smoothness: {v}%"))
+        self._bind_value_label(self.spec_smooth_slider, self.spec_smooth_label, "Smoothness: {}%")
+        self.spec_smooth_slider.valueChanged.connect(self.on_smoothness_changed)
         
         self.spec_sens_label = QLabel("Sensitivity: 100%")
         self.spec_sens_slider = QSlider(Qt.Horizontal)
         self.spec_sens_slider.setRange(10, 300)
         self.spec_sens_slider.setValue(100)
-        self.spec_sens_slider.valueChanged.connect(lambda v: self.spec_sens_label.setText(f"Sensitivity: {v}%"))
+        self._bind_value_label(self.spec_sens_slider, self.spec_sens_label, "Sensitivity: {}%")
         
         self.spec_pos_box = QComboBox()
         self.spec_pos_box.addItems(["Bottom", "Top", "Center", "Custom"])
         
         self.color_btn = QPushButton("Select Spectrum Color")
-        self.color_btn.setStyleSheet(f"background-color: {self.spectrum_color.name()}; color: #000;")
+        self.set_button_color(self.color_btn, self.spectrum_color)
         self.color_btn.clicked.connect(self.choose_color)
         spec_layout.addWidget(self.spectrum_chk)
         spec_layout.addWidget(QLabel("Style:"))
@@ -843,18 +1379,16 @@ class MainWindow(QMainWindow):
         
         self.text_color = QColor("white")
         self.text_color_btn = QPushButton("Select Text Color")
-        self.text_color_btn.setStyleSheet(f"background-color: {self.text_color.name()}; color: #000;")
+        self.set_button_color(self.text_color_btn, self.text_color)
         self.text_color_btn.clicked.connect(self.choose_text_color)
 
-        self.font_box = QComboBox()
-        self.font_box.addItems(QFontDatabase.families())
-        self.font_box.setCurrentText("Arial")
+        self.font_box = FontComboBox("Arial")
         
         self.font_size_label = QLabel("Font Size: 70")
         self.font_size_slider = QSlider(Qt.Horizontal)
         self.font_size_slider.setRange(10, 300)
         self.font_size_slider.setValue(70)
-        self.font_size_slider.valueChanged.connect(lambda v: self.font_size_label.setText(f"Font Size: {v}"))
+        self._bind_value_label(self.font_size_slider, self.font_size_label, "Font Size: {}")
         
         self.text_pos_box = QComboBox()
         self.text_pos_box.addItems(["Center", "Top", "Bottom", "Custom"])
@@ -869,13 +1403,13 @@ class MainWindow(QMainWindow):
         border_row = QHBoxLayout()
         self.text_border_color = QColor("black")
         self.text_border_color_btn = QPushButton("Border Color")
-        self.text_border_color_btn.setStyleSheet(f"background-color: {self.text_border_color.name()}; color: #fff;")
+        self.set_button_color(self.text_border_color_btn, self.text_border_color, "#fff")
         self.text_border_color_btn.clicked.connect(self.choose_border_color)
         
         self.text_border_width = QSpinBox()
         self.text_border_width.setRange(1, 20)
         self.text_border_width.setValue(2)
-        self.text_border_width.valueChanged.connect(self.apply_text_preview)
+        self.text_border_width.valueChanged.connect(self._throttled(self.apply_text_preview))
         
         border_row.addWidget(self.text_border_color_btn)
         border_row.addWidget(QLabel("Width:"))
@@ -905,7 +1439,7 @@ class MainWindow(QMainWindow):
         self.lyrics_list.setDragDropMode(QAbstractItemView.InternalMove)
         self.lyrics_list.setDefaultDropAction(Qt.MoveAction)
         self.lyrics_list.setMinimumHeight(100)
-        self.lyrics_list.model().rowsMoved.connect(self.update_lyrics_paths_from_list)
+        self.lyrics_list.model().rowsMoved.connect(self.on_lyrics_rows_moved)
 
         lyric_btns = QHBoxLayout()
         self.add_lyrics_btn = QPushButton("Add Lyrics Files")
@@ -917,20 +1451,18 @@ class MainWindow(QMainWindow):
         
         self.lyrics_color = QColor("white")
         self.lyrics_color_btn = QPushButton("Lyrics Color")
-        self.lyrics_color_btn.setStyleSheet(f"background-color: {self.lyrics_color.name()}; color: #000;")
+        self.set_button_color(self.lyrics_color_btn, self.lyrics_color)
         self.lyrics_color_btn.clicked.connect(self.choose_lyrics_color)
         
-        self.lyrics_font_box = QComboBox()
-        self.lyrics_font_box.addItems(QFontDatabase.families())
-        self.lyrics_font_box.setCurrentText("Arial")
+        self.lyrics_font_box = FontComboBox("Arial")
         self.lyrics_font_box.currentTextChanged.connect(self.apply_lyrics_preview)
         
         self.lyrics_size_label = QLabel("Font Size: 50")
         self.lyrics_size_slider = QSlider(Qt.Horizontal)
         self.lyrics_size_slider.setRange(10, 150)
         self.lyrics_size_slider.setValue(50)
-        self.lyrics_size_slider.valueChanged.connect(lambda v: self.lyrics_size_label.setText(f"Font Size: {v}"))
-        self.lyrics_size_slider.valueChanged.connect(self.apply_lyrics_preview)
+        self._bind_value_label(self.lyrics_size_slider, self.lyrics_size_label, "Font Size: {}")
+        self.lyrics_size_slider.valueChanged.connect(self._throttled(self.apply_lyrics_preview))
         
         self.lyrics_pos_box = QComboBox()
         self.lyrics_pos_box.addItems(["Bottom", "Top", "Center", "Custom"])
@@ -958,7 +1490,7 @@ class MainWindow(QMainWindow):
         self.lyrics_box_opacity_slider = QSlider(Qt.Horizontal)
         self.lyrics_box_opacity_slider.setRange(0, 255)
         self.lyrics_box_opacity_slider.setValue(128)
-        self.lyrics_box_opacity_slider.valueChanged.connect(self.apply_lyrics_preview)
+        self.lyrics_box_opacity_slider.valueChanged.connect(self._throttled(self.apply_lyrics_preview))
         box_layout.addWidget(self.lyrics_box_color_btn)
         box_layout.addWidget(self.lyrics_box_opacity_slider)
 
@@ -991,8 +1523,8 @@ class MainWindow(QMainWindow):
         self.logo_size_slider = QSlider(Qt.Horizontal)
         self.logo_size_slider.setRange(1, 50)
         self.logo_size_slider.setValue(15)
-        self.logo_size_slider.valueChanged.connect(lambda v: self.logo_size_label.setText(f"Logo Size: {v}%"))
-        self.logo_size_slider.valueChanged.connect(self.apply_logo_preview)
+        self._bind_value_label(self.logo_size_slider, self.logo_size_label, "Logo Size: {}%")
+        self.logo_size_slider.valueChanged.connect(self._throttled(self.apply_logo_preview))
         
         self.logo_pos_box = QComboBox()
         self.logo_pos_box.addItems(["Top Right", "Top Left", "Bottom Right", "Bottom Left", "Center"])
@@ -1015,15 +1547,15 @@ class MainWindow(QMainWindow):
         
         self.prog_color = QColor("#2ecc71")
         self.prog_color_btn = QPushButton("Bar Color")
-        self.prog_color_btn.setStyleSheet(f"background-color: {self.prog_color.name()}; color: #000;")
+        self.set_button_color(self.prog_color_btn, self.prog_color)
         self.prog_color_btn.clicked.connect(self.choose_prog_color)
         
         self.prog_height_label = QLabel("Height: 2%")
         self.prog_height_slider = QSlider(Qt.Horizontal)
         self.prog_height_slider.setRange(1, 20)
         self.prog_height_slider.setValue(2)
-        self.prog_height_slider.valueChanged.connect(lambda v: self.prog_height_label.setText(f"Height: {v}%"))
-        self.prog_height_slider.valueChanged.connect(self.apply_prog_preview)
+        self._bind_value_label(self.prog_height_slider, self.prog_height_label, "Height: {}%")
+        self.prog_height_slider.valueChanged.connect(self._throttled(self.apply_prog_preview))
         
         self.prog_pos_box = QComboBox()
         self.prog_pos_box.addItems(["Bottom", "Top"])
@@ -1097,6 +1629,40 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(sidebar)
         main_layout.addWidget(self.preview_area, 1)
+        # Plain widget-backed preset fields: (key, getter, setter, default)
+        self._preset_fields = [
+            ("resolution", self.controls.res_box.currentText, self.controls.res_box.setCurrentText, "1080p"),
+            ("aspect_ratio", self.controls.ar_box.currentText, self.controls.ar_box.setCurrentText, "16:9"),
+            ("processor", self.controls.proc_box.currentText, self.controls.proc_box.setCurrentText, "CPU"),
+            ("duration", self.dur_input.value, self.dur_input.setValue, 3),
+            ("spectrum", self.spectrum_chk.isChecked, self.spectrum_chk.setChecked, False),
+            ("spectrum_style", self.spec_style_box.currentText, self.spec_style_box.setCurrentText, "Bars"),
+            ("spectrum_size", self.spec_size_slider.value, self.spec_size_slider.setValue, 50),
+            ("spectrum_thickness", self.spec_thick_slider.value, self.spec_thick_slider.setValue, 80),
+            ("spectrum_smoothness", self.spec_smooth_slider.value, self.spec_smooth_slider.setValue, 0),
+            ("spectrum_sensitivity", self.spec_sens_slider.value, self.spec_sens_slider.setValue, 100),
+            ("spectrum_pos", self.spec_pos_box.currentText, self.spec_pos_box.setCurrentText, "Bottom"),
+            ("text", self.text_input.text, self.text_input.setText, ""),
+            ("text_shadow", self.text_shadow_chk.isChecked, self.text_shadow_chk.setChecked, False),
+            ("text_border_enabled", self.text_border_chk.isChecked, self.text_border_chk.setChecked, False),
+            ("text_border_width", self.text_border_width.value, self.text_border_width.setValue, 2),
+            ("font", self.font_box.selected_family, self.font_box.setCurrentText, "Arial"),
+            ("font_size", self.font_size_slider.value, self.font_size_slider.setValue, 70),
+            ("text_pos", self.text_pos_box.currentText, self.text_pos_box.setCurrentText, "Center"),
+            ("lyrics_font", self.lyrics_font_box.selected_family, self.lyrics_font_box.setCurrentText, "Arial"),
+            ("lyrics_fontsize", self.lyrics_size_slider.value, self.lyrics_size_slider.setValue, 50),
+            ("lyrics_pos", self.lyrics_pos_box.currentText, self.lyrics_pos_box.setCurrentText, "Bottom"),
+            ("lyrics_bounce", self.lyrics_bounce_chk.isChecked, self.lyrics_bounce_chk.setChecked, False),
+            ("lyrics_karaoke", self.lyrics_karaoke_chk.isChecked, self.lyrics_karaoke_chk.setChecked, False),
+            ("lyrics_scrolling", self.lyrics_scroll_chk.isChecked, self.lyrics_scroll_chk.setChecked, False),
+            ("lyrics_bg_dim", self.lyrics_dim_chk.isChecked, self.lyrics_dim_chk.setChecked, False),
+            ("lyrics_box_enabled", self.lyrics_box_chk.isChecked, self.lyrics_box_chk.setChecked, False),
+            ("logo_size", self.logo_size_slider.value, self.logo_size_slider.setValue, 15),
+            ("logo_pos", self.logo_pos_box.currentText, self.logo_pos_box.setCurrentText, "Top Right"),
+            ("progressbar_enabled", self.prog_chk.isChecked, self.prog_chk.setChecked, False),
+            ("progressbar_height", self.prog_height_slider.value, self.prog_height_slider.setValue, 2),
+            ("progressbar_pos", self.prog_pos_box.currentText, self.prog_pos_box.setCurrentText, "Bottom"),
+        ]
         
         self.render_btn.clicked.connect(self.start_task)
         self.save_btn.clicked.connect(self.save_preset)
@@ -1105,9 +1671,14 @@ class MainWindow(QMainWindow):
         
         # Live preview connections
         self.spectrum_chk.stateChanged.connect(self.update_spectrum_preview)
-        self.text_input.textChanged.connect(self.apply_text_preview)
+        self.spec_style_box.currentTextChanged.connect(self.update_spectrum_preview)
+        self.spec_size_slider.valueChanged.connect(self._throttled(self.update_spectrum_preview))
+        self.spec_thick_slider.valueChanged.connect(self._throttled(self.update_spectrum_preview))
+        self.spec_sens_slider.valueChanged.connect(self._throttled(self.update_spectrum_preview))
+        self.spec_pos_box.currentTextChanged.connect(self.update_spectrum_preview)
+        self.text_input.textChanged.connect(self._throttled(self.apply_text_preview))
         self.font_box.currentTextChanged.connect(self.apply_text_preview)
-        self.font_size_slider.valueChanged.connect(self.apply_text_preview)
+        self.font_size_slider.valueChanged.connect(self._throttled(self.apply_text_preview))
         self.text_pos_box.currentTextChanged.connect(self.apply_text_preview)
 
         # Exclusive Lyrics Mode Logic
@@ -1115,6 +1686,30 @@ class MainWindow(QMainWindow):
         self.lyrics_karaoke_chk.clicked.connect(self.on_lyrics_mode_changed)
         self.lyrics_scroll_chk.clicked.connect(self.on_lyrics_mode_changed)
 
+    def _bind_value_label(self, slider, label, fmt):
+        # All slider readouts share one slot instead of a closure each
+        self._slider_labels[slider] = (label, fmt)
+        slider.valueChanged.connect(self._on_slider_value)
+
+    def _on_slider_value(self, value):
+        label, fmt = self._slider_labels[self.sender()]
+        label.setText(fmt.format(value))
+
+    def _throttled(self, fn, interval=16):
+        # Slider drags emit valueChanged for every step; run fn at most once per interval.
+        # One timer per target, so several sliders feeding the same preview share it.
+        timer = self._throttle_timers.get(fn)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(interval)
+            timer.timeout.connect(fn)
+            self._throttle_timers[fn] = timer
+        def trigger(*args):
+            if not timer.isActive():
+                timer.start()
+        return trigger
+
     def toggle_preview(self):
         if self.is_playing:
             self.stop_preview()
@@ -1129,23 +1724,28 @@ class MainWindow(QMainWindow):
         
         # Video
         video_path = self.controls.video_path
-        if video_path and video_path.lower().endswith(('.mp4', '.mov', '.avi', '.mkv')):
+        if video_path and video_path.lower().endswith(VIDEO_EXTS):
             self.media_player.setSource(QUrl.fromLocalFile(video_path))
             self.media_player.setLoops(-1) # Infinite loop
             self.media_player.play()
             
         self.play_btn.setText("⏹ Stop Preview")
         self.is_playing = True
+        self.frame_timer.start()
 
     def stop_preview(self):
-        self.preview_timer.stop()
+        self.frame_timer.stop()
+        self._audio_pos = None
         self.media_player.stop()
-        self.music_player.stop()
+        self.audio_thread.stop_requested.emit()
+        self.cancel_spectrum()
         self.play_btn.setText("▶ Play Preview")
         self.is_playing = False
         self.preview_area.lyrics_text = "Lyrics Preview Line"
         self.preview_area.set_live_heights(None)
         self.preview_area.set_live_progress(0)
+        self._last_prog = 0.0
+        self._last_frame_idx = -1
         self.current_smooth_heights = None
         self.preview_area.lyrics_progress = 0.0
         self.preview_area.set_media_info("None", "None")
@@ -1153,18 +1753,36 @@ class MainWindow(QMainWindow):
     def play_next_song(self):
         if self.audio_queue:
             song = self.audio_queue.pop(0)
-            self.music_player.setSource(QUrl.fromLocalFile(song))
-            self.music_player.play()
+            self.current_song = song
+            self.music_duration = 0
+            self._audio_pos = None # Hold the preview until the new song reports a position
+            # A one-song playlist loops inside the player, so it never hits EndOfMedia
+            loops = -1 if not self.audio_queue else 1 # -1: infinite
+            self.audio_thread.play_requested.emit(song, loops)
             self.audio_queue.append(song) # Loop playlist
             self.sync_lyrics_to_song(song)
             
             # Start spectrum analysis
             self.spectrum_data = None
+            self.current_smooth_heights = None # Don't ease in from the previous song's bars
+            self._last_frame_idx = -1
+            self.cancel_spectrum()
+            key = (song, self.spectrum_fps)
+            if key in self._spectrum_cache:
+                # Playlist wrapped around to a song we already analyzed
+                self._spectrum_cache.move_to_end(key)
+                self.spectrum_data = self._spectrum_cache[key]
+                return
             self.spec_worker = SpectrumWorker(song, fps=self.spectrum_fps)
-            self.spec_worker.finished.connect(self.on_spectrum_ready)
-            self.spec_worker.start()
-            
-            self.preview_timer.start(int(1000/self.spectrum_fps))
+            self.spec_worker.signals.partial.connect(self.on_spectrum_partial)
+            self.spec_worker.signals.finished.connect(self.on_spectrum_ready)
+            QThreadPool.globalInstance().start(self.spec_worker)
+
+    def cancel_spectrum(self):
+        # Don't spend STFT work on a song that is no longer playing
+        if self.spec_worker is not None:
+            self.spec_worker.cancel()
+            self.spec_worker = None
 
     def sync_lyrics_to_song(self, song_path):
         # Match by index in the list
@@ -1184,99 +1802,159 @@ class MainWindow(QMainWindow):
         if matched:
             self.parse_lyrics(matched)
             self.apply_lyrics_preview()
-            lyrics_name = os.path.basename(matched)
+            lyrics_name = self._lyrics_names.get(matched) or os.path.basename(matched)
         else:
-            self.parsed_lyrics = []
+            self.set_parsed_lyrics([])
             self.preview_area.lyrics_text = ""
-            self.preview_area.update()
+            self.preview_area.schedule_update()
         
         self.preview_area.set_media_info(audio_name, lyrics_name)
 
+    def on_spectrum_partial(self, offset, chunk, total_frames):
+        if self.spec_worker is None or self.sender() is not self.spec_worker.signals:
+            return # Result for a song that is no longer playing
+        # Stored frame-major so each playback tick reads one contiguous row
+        if self.spectrum_data is None or self.spectrum_data.shape != (total_frames, chunk.shape[0]):
+            self.spectrum_data = np.zeros((total_frames, chunk.shape[0]), dtype=np.float32)
+        self.spectrum_data[offset:offset + chunk.shape[1]] = chunk.T
+
     def on_spectrum_ready(self, data):
+        if self.spec_worker is None or self.sender() is not self.spec_worker.signals:
+            return
         self.spectrum_data = data
+        if data is not None:
+            self._spectrum_cache[(self.spec_worker.audio_path, self.spec_worker.fps)] = data
+            if len(self._spectrum_cache) > SPECTRUM_MEMORY_CACHE_SIZE:
+                self._spectrum_cache.popitem(last=False)
+
+    def preview_visible(self):
+        # Minimized windows still report a visible region, so check the window state too
+        return not self.isMinimized() and not self.preview_area.visibleRegion().isEmpty()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            # Restored: let the next position tick redraw even if the frame index matches
+            self._last_frame_idx = -1
+        super().changeEvent(event)
+
+    def on_audio_position(self, pos_ms):
+        self._audio_pos = (pos_ms, time.monotonic())
+
+    def on_frame_tick(self):
+        if self._audio_pos is None:
+            return
+        # Extrapolate from the last report; capped so a stalled player doesn't run ahead
+        pos_ms, stamp = self._audio_pos
+        pos_ms += min(time.monotonic() - stamp, 0.25) * 1000.0
+        if self.music_duration > 0:
+            pos_ms = min(pos_ms, self.music_duration)
+        self.update_playback_loop(pos_ms)
+
+    def update_playback_loop(self, pos_ms):
+        # Nothing to show while minimized; audio keeps playing regardless
+        if not self.is_playing or not self.preview_visible():
+            return
+        # Stream not ready yet and nothing else to animate
+        if self.music_duration <= 0 and self.spectrum_data is None and not self.lyric_texts:
+            return
 
-    def update_playback_loop(self):
-        if not self.is_playing:
+        # Nothing new to draw until the player advances a whole frame
+        frame = int((pos_ms / 1000.0) * self.spectrum_fps)
+        if frame == self._last_frame_idx:
             return
+        self._last_frame_idx = frame
 
-        duration = self.music_player.duration()
-        if duration > 0:
-            pos = self.music_player.position()
-            progress = pos / duration
-            self.preview_area.set_live_progress(progress)
-        else:
-            self.preview_area.set_live_progress(0)
+        # Collected here and handed to the preview in one call at the end
+        state = {}
 
-        if self.lyrics_path and self.parsed_lyrics:
-            current_sec = self.music_player.position() / 1000.0
-            
-            self.preview_area.full_lyrics = self.parsed_lyrics
-            self.preview_area.current_time = current_sec
-            found_line = False
-            for (start, end), text in self.parsed_lyrics:
-                if start <= current_sec <= end:
-                    self.preview_area.lyrics_text = text
-                    if end > start:
-                        self.preview_area.lyrics_progress = (current_sec - start) / (end - start)
-                    else:
-                        self.preview_area.lyrics_progress = 1.0
-                    found_line = True
-                    break
+        duration = self.music_duration
+        progress = pos_ms / duration if duration > 0 else 0.0
+        # Sub-pixel changes of the bar don't render
+        if abs(progress - self._last_prog) > 1.0 / max(1, self.preview_area.width()) or progress == 0.0:
+            if progress != self.preview_area.live_progress:
+                state['live_progress'] = progress
+            self._last_prog = progress
+
+        if self.lyrics_path and self.lyric_texts:
+            current_sec = pos_ms / 1000.0
             
-            if not found_line:
-                self.preview_area.lyrics_text = ""
-                self.preview_area.lyrics_progress = 0.0
+            state['current_time'] = current_sec
+            i = self.preview_area.active_lyric(current_sec)
+            if i >= 0:
+                start, end = self.lyric_starts[i], self.lyric_ends[i]
+                state['lyrics_text'] = self.lyric_texts[i]
+                state['lyrics_progress'] = (current_sec - start) / (end - start) if end > start else 1.0
+            else:
+                state['lyrics_text'] = ""
+                state['lyrics_progress'] = 0.0
 
         if self.spectrum_data is not None:
-            pos_ms = self.music_player.position()
-            frame = int((pos_ms / 1000.0) * self.spectrum_fps)
-            if frame < self.spectrum_data.shape[1]:
-                raw_heights = self.spectrum_data[:, frame]
+            if frame < self.spectrum_data.shape[0]:
+                raw_heights = self.spectrum_data[frame]
                 
-                smoothness = self.spec_smooth_slider.value()
-                if smoothness > 0:
-                    alpha = 1 - (smoothness / 100.0)
+                alpha = self.smooth_alpha
+                if alpha < 1.0:
                     if self.current_smooth_heights is None:
-                        self.current_smooth_heights = raw_heights
+                        # Own copy: the EMA below updates it in place
+                        self.current_smooth_heights = np.array(raw_heights, dtype=np.float32)
                     else:
-                        self.current_smooth_heights = alpha * raw_heights + (1 - alpha) * self.current_smooth_heights
+                        # Rows of a cached spectrum are read-only memmap slices; stage them in one
+                        # writable float32 buffer so the kernel only ever sees its compiled signature
+                        raw = self._ema_raw
+                        if raw is None or raw.shape != raw_heights.shape:
+                            raw = self._ema_raw = np.empty(raw_heights.shape, dtype=np.float32)
+                        np.copyto(raw, raw_heights)
+                        ema(self.current_smooth_heights, raw, alpha, self.current_smooth_heights)
                     heights = self.current_smooth_heights
                 else:
                     heights = raw_heights
                     self.current_smooth_heights = None
-                self.preview_area.set_live_heights(heights) # This calls update()
-        else:
-            # If spectrum is off, we still need to update for the progress bar
-            self.preview_area.update()
+                state['live_heights'] = heights
+
+        self.preview_area.set_frame_state(state)
+
+    def on_smoothness_changed(self, value):
+        # Read once per slider change instead of once per frame
+        self.smooth_alpha = 1 - (value / 100.0)
+
+    def on_music_duration(self, duration):
+        self.music_duration = duration
 
     def handle_music_status(self, status):
         if status == QMediaPlayer.EndOfMedia:
             self.play_next_song()
 
-    def handle_video_frame(self):
-        frame = self.video_sink.videoFrame()
-        if frame.isValid():
+    def handle_video_frame(self, frame):
+        if not frame.isValid():
+            return
+        # Only skip hidden frames during playback; a paused thumbnail (update_preview) must always land
+        if self.is_playing and not self.preview_visible():
+            return
+        image = None
+        if frame.pixelFormat() in RGB32_FRAME_FORMATS and frame.map(QVideoFrame.ReadOnly):
+            # Already RGB: wrap the mapped plane and copy once instead of toImage()'s conversion pass
+            try:
+                image = QImage(frame.bits(0), frame.width(), frame.height(), frame.bytesPerLine(0), QImage.Format_RGB32).copy()
+            finally:
+                frame.unmap()
+        if image is None:
             image = frame.toImage()
-            self.preview_area.set_pixmap(QPixmap.fromImage(image))
+        self.preview_area.set_pixmap(QPixmap.fromImage(image))
 
     def update_preview(self, path):
         self.stop_preview()
-        pixmap = None
-        if path.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
-            pixmap = QPixmap(path)
-        elif path.lower().endswith(('.mp4', '.mov', '.avi', '.mkv')):
-            try:
-                clip = VideoFileClip(path)
-                frame = clip.get_frame(0)
-                h, w, c = frame.shape
-                qImg = QImage(frame.data, w, h, w * 3, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qImg)
-                clip.close()
-            except Exception as e:
-                self.preview_area.setText(f"Preview Error: {e}")
-        
-        if pixmap:
-            self.preview_area.set_pixmap(pixmap)
+        lower_path = path.lower()
+        if lower_path.endswith(IMAGE_EXTS):
+            self.preview_area.set_pixmap(QPixmap(path))
+        elif lower_path.endswith(VIDEO_EXTS):
+            self.preview_area.set_status_text("Loading...")
+            # Pausing a freshly loaded source decodes just the first frame into the video sink
+            self.media_player.setSource(QUrl.fromLocalFile(path))
+            self.media_player.setPosition(0)
+            self.media_player.pause()
+
+    def on_video_error(self, error, err_msg):
+        self.preview_area.set_status_text(f"Preview Error: {err_msg}")
 
     def on_text_dragged(self):
         self.text_pos_box.setCurrentText("Custom")
@@ -1292,16 +1970,10 @@ class MainWindow(QMainWindow):
 
     def apply_text_preview(self):
         self.set_active_drag("text")
-        res_map = {"720p": 720, "1080p": 1080, "2K": 1440, "4K": 2160}
-        target_h = res_map.get(self.controls.res_box.currentText(), 1080)
-        
-        pos_selection = self.text_pos_box.currentText()
-        if pos_selection == "Center":
-            self.preview_area.rel_pos = [0.5, 0.5]
-        elif pos_selection == "Top":
-            self.preview_area.rel_pos = [0.5, 0.1]
-        elif pos_selection == "Bottom":
-            self.preview_area.rel_pos = [0.5, 0.9]
+        target_h = RES_HEIGHTS.get(self.controls.res_box.currentText(), 1080)
+        
+        pos = TEXT_POS_PRESETS.get(self.text_pos_box.currentText())
+        if pos: self.preview_area.rel_pos = list(pos)
             
         self.preview_area.set_overlay_settings(
             self.text_input.text(),
@@ -1325,22 +1997,12 @@ class MainWindow(QMainWindow):
         thickness = self.spec_thick_slider.value()
         sensitivity = self.spec_sens_slider.value()
         self.preview_area.set_spectrum_preview(enabled, color, style, size, pos, thickness, sensitivity)
-        
-        # Connect signals for live update
-        if not hasattr(self, 'spec_signals_connected'):
-            self.spec_style_box.currentTextChanged.connect(self.update_spectrum_preview)
-            self.spec_size_slider.valueChanged.connect(self.update_spectrum_preview)
-            self.spec_thick_slider.valueChanged.connect(self.update_spectrum_preview)
-            self.spec_smooth_slider.valueChanged.connect(self.update_spectrum_preview)
-            self.spec_sens_slider.valueChanged.connect(self.update_spectrum_preview)
-            self.spec_pos_box.currentTextChanged.connect(self.update_spectrum_preview)
-            self.spec_signals_connected = True
 
     def apply_lyrics_preview(self):
         self.preview_area.active_drag = "lyrics"
-        enabled = bool(self.lyrics_path)
-        self.preview_area.set_lyrics_settings(
-            enabled,
+        box_color = self.lyrics_box_qcolor()
+        settings = (
+            bool(self.lyrics_path),
             self.lyrics_font_box.currentText(),
             self.lyrics_size_slider.value(),
             self.lyrics_color,
@@ -1350,8 +2012,24 @@ class MainWindow(QMainWindow):
             self.lyrics_scroll_chk.isChecked(),
             self.lyrics_dim_chk.isChecked(),
             self.lyrics_box_chk.isChecked(),
-            QColor(self.lyrics_box_color.red(), self.lyrics_box_color.green(), self.lyrics_box_color.blue(), self.lyrics_box_opacity_slider.value())
+            box_color
         )
+        # Spurious signals (e.g. preset loads, mode toggles) often resend identical settings
+        state = settings[:3] + (self.lyrics_color.rgba(),) + settings[4:10] + (box_color.rgba(), tuple(self.preview_area.lyrics_rel_pos))
+        if state == self._last_lyrics_state:
+            return
+        self.preview_area.set_lyrics_settings(*settings)
+        self._last_lyrics_state = state[:-1] + (tuple(self.preview_area.lyrics_rel_pos),)
+
+    def lyrics_box_qcolor(self):
+        # Reuse the QColor while the box color/opacity stay the same
+        c = self.lyrics_box_color
+        rgba = (c.red(), c.green(), c.blue(), self.lyrics_box_opacity_slider.value())
+        key, cached = self._lyrics_box_qcolor_cache
+        if key != rgba:
+            cached = QColor(*rgba)
+            self._lyrics_box_qcolor_cache = (rgba, cached)
+        return cached
 
     def on_lyrics_mode_changed(self):
         sender = self.sender()
@@ -1367,77 +2045,93 @@ class MainWindow(QMainWindow):
                 self.lyrics_karaoke_chk.setChecked(False)
         self.apply_lyrics_preview()
 
+    def set_button_color(self, btn, color, fg="#000"):
+        # Restyling re-parses the button's stylesheet, so skip it when nothing changed.
+        # A QPalette swatch would be cheaper, but DARK_STYLESHEET's QPushButton rule overrides palettes.
+        key = (color.rgb(), fg)
+        if self._btn_colors.get(btn) == key:
+            return
+        self._btn_colors[btn] = key
+        css = self._color_css_cache.get(key)
+        if css is None:
+            css = self._color_css_cache[key] = BTN_QSS_TPL.format(color.name(), fg)
+        btn.setStyleSheet(css)
+
     def choose_color(self):
         color = QColorDialog.getColor(self.spectrum_color, self, "Choose Spectrum Color")
         if color.isValid():
             self.spectrum_color = color
-            self.color_btn.setStyleSheet(f"background-color: {color.name()}; color: #000;")
+            self.set_button_color(self.color_btn, color)
             self.update_spectrum_preview()
 
     def choose_text_color(self):
         color = QColorDialog.getColor(self.text_color, self, "Choose Text Color")
         if color.isValid():
             self.text_color = color
-            self.text_color_btn.setStyleSheet(f"background-color: {color.name()}; color: #000;")
+            self.set_button_color(self.text_color_btn, color)
             self.apply_text_preview()
 
     def choose_lyrics_color(self):
         color = QColorDialog.getColor(self.lyrics_color, self, "Choose Lyrics Color")
         if color.isValid():
             self.lyrics_color = color
-            self.lyrics_color_btn.setStyleSheet(f"background-color: {color.name()}; color: #000;")
+            self.set_button_color(self.lyrics_color_btn, color)
             self.apply_lyrics_preview()
 
     def choose_border_color(self):
         color = QColorDialog.getColor(self.text_border_color, self, "Choose Border Color")
         if color.isValid():
             self.text_border_color = color
-            self.text_border_color_btn.setStyleSheet(f"background-color: {color.name()}; color: #fff;")
+            self.set_button_color(self.text_border_color_btn, color, "#fff")
             self.apply_text_preview()
 
     def choose_lyrics_box_color(self):
         color = QColorDialog.getColor(self.lyrics_box_color, self, "Choose Box Color")
         if color.isValid():
-            self.lyrics_box_color = color
-            # Update opacity from slider
-            self.lyrics_box_color.setAlpha(self.lyrics_box_opacity_slider.value())
-            self.lyrics_box_color_btn.setStyleSheet(f"background-color: {color.name()}; color: #fff;")
+            # Opacity comes from the slider
+            self.lyrics_box_color = QColor(color.red(), color.green(), color.blue(), self.lyrics_box_opacity_slider.value())
+            self.set_button_color(self.lyrics_box_color_btn, self.lyrics_box_color, "#fff")
             self.apply_lyrics_preview()
 
+    def set_parsed_lyrics(self, entries):
+        # Stored as parallel arrays (start, end, text) so lookups can binary-search the times
+        self.lyric_starts = np.array([s for (s, e), _ in entries], dtype=np.float64)
+        self.lyric_ends = np.array([e for (s, e), _ in entries], dtype=np.float64)
+        self.lyric_texts = [t for _, t in entries]
+        self.preview_area.set_full_lyrics(self.lyric_starts, self.lyric_ends, self.lyric_texts)
+
+    @property
+    def parsed_lyrics(self):
+        # Old ((start, end), text) view, for code that still expects it
+        return list(zip(zip(self.lyric_starts.tolist(), self.lyric_ends.tolist()), self.lyric_texts))
+
+    def lyrics_entries(self, path):
+        # Parsed once per file; the mtime check still picks up edits made while the app runs
+        mtime = os.path.getmtime(path)
+        cached = self._lyric_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        entries = read_lyrics_file(path)
+        self._lyric_cache[path] = (mtime, entries)
+        return entries
+
+    def preload_lyrics(self, paths):
+        for path in paths:
+            try:
+                self.lyrics_entries(path)
+            except Exception as e:
+                print(f"Lyrics Parse Error: {e}")
+
     def parse_lyrics(self, path):
-        self.parsed_lyrics = []
+        self.set_parsed_lyrics([])
         if not path or not os.path.exists(path):
             return
         
         try:
-            if path.lower().endswith('.srt'):
-                self.parsed_lyrics = file_to_subtitles(path)
-            elif path.lower().endswith('.lrc'):
-                with open(path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                parsed = []
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('[') and ']' in line:
-                        idx = line.find(']')
-                        time_str = line[1:idx]
-                        content = line[idx+1:].strip()
-                        parts = time_str.split(':')
-                        if len(parts) == 2:
-                            try:
-                                sec = float(parts[0])*60 + float(parts[1])
-                                parsed.append((sec, content))
-                            except ValueError:
-                                continue
-                for i in range(len(parsed)):
-                    s, t = parsed[i]
-                    if not t: continue
-                    e = parsed[i+1][0] if i < len(parsed)-1 else s + 10.0
-                    self.parsed_lyrics.append(((s, e), t))
-            
-            if self.parsed_lyrics:
-                self.preview_area.lyrics_text = self.parsed_lyrics[0][1]
-                self.preview_area.update()
+            self.set_parsed_lyrics(self.lyrics_entries(path))
+            if self.lyric_texts:
+                self.preview_area.lyrics_text = self.lyric_texts[0]
+                self.preview_area.schedule_update()
         except Exception as e:
             print(f"Lyrics Parse Error: {e}")
 
@@ -1445,33 +2139,57 @@ class MainWindow(QMainWindow):
         paths, _ = QFileDialog.getOpenFileNames(self, "Select Lyrics", "", "Lyrics (*.srt *.lrc)")
         if paths:
             for path in paths:
-                if path not in self.lyrics_paths:
+                if path not in self._lyrics_paths_set:
+                    self._lyrics_paths_set.add(path)
                     self.lyrics_paths.append(path)
-                    item = QListWidgetItem(os.path.basename(path))
-                    item.setData(Qt.UserRole, path)
-                    self.lyrics_list.addItem(item)
+                    self._add_lyrics_item(path)
             
             if self.lyrics_paths:
                 self.lyrics_path = self.lyrics_paths[0]
+            self.preload_lyrics(paths)
             
             # Sync immediately if playing
-            if self.music_player.playbackState() == QMediaPlayer.PlayingState:
-                current_source = self.music_player.source().toLocalFile()
-                if current_source:
-                    self.sync_lyrics_to_song(current_source)
+            if self.is_playing and self.current_song:
+                self.sync_lyrics_to_song(self.current_song)
+
+    def _add_lyrics_item(self, path):
+        # Basename is computed once and kept with the item for later lookups
+        name = self._lyrics_names.get(path)
+        if name is None:
+            name = self._lyrics_names[path] = os.path.basename(path)
+        item = QListWidgetItem(name)
+        item.setData(Qt.UserRole, path)
+        item.setData(Qt.UserRole + 1, name)
+        self.lyrics_list.addItem(item)
+
+    def on_lyrics_rows_moved(self, parent, start, end, dest_parent, row):
+        # Apply the move to lyrics_paths directly instead of re-reading every item
+        if len(self.lyrics_paths) != self.lyrics_list.count():
+            self.update_lyrics_paths_from_list()
+            return
+        moved = self.lyrics_paths[start:end + 1]
+        del self.lyrics_paths[start:end + 1]
+        if row > end:
+            row -= len(moved)
+        self.lyrics_paths[row:row] = moved
+        self.lyrics_path = self.lyrics_paths[0]
 
     def update_lyrics_paths_from_list(self):
         self.lyrics_paths = [self.lyrics_list.item(i).data(Qt.UserRole) for i in range(self.lyrics_list.count())]
+        self._lyrics_paths_set = set(self.lyrics_paths)
         if self.lyrics_paths:
             self.lyrics_path = self.lyrics_paths[0]
             
     def clear_lyrics_list(self):
         self.lyrics_list.clear()
         self.lyrics_paths = []
+        self._lyrics_paths_set.clear()
+        self._lyrics_names.clear()
         self.lyrics_path = ""
-        self.parsed_lyrics = []
+        self._lyric_cache.clear()
+        self.set_parsed_lyrics([])
         self.preview_area.lyrics_text = ""
-        self.preview_area.update()
+        self.preview_area.schedule_update()
 
     def select_logo(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select Logo", "", "Images (*.png *.jpg *.jpeg *.webp)")
@@ -1484,7 +2202,7 @@ class MainWindow(QMainWindow):
         color = QColorDialog.getColor(self.prog_color, self, "Choose Bar Color")
         if color.isValid():
             self.prog_color = color
-            self.prog_color_btn.setStyleSheet(f"background-color: {color.name()}; color: #000;")
+            self.set_button_color(self.prog_color_btn, color)
             self.apply_prog_preview()
 
     def apply_prog_preview(self):
@@ -1498,60 +2216,32 @@ class MainWindow(QMainWindow):
     def apply_logo_preview(self):
         self.preview_area.set_logo_settings(self.logo_path, self.logo_size_slider.value(), self.logo_pos_box.currentText())
 
+    def widget_values(self):
+        return {k: get() for k, get, _, _ in self._preset_fields}
+
     def save_preset(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save Preset", "", "JSON Files (*.json)")
         if not path: return
         
-        data = {
+        data = self.widget_values()
+        data.update({
             "video_path": self.controls.video_path,
             "audio_paths": self.controls.audio_paths,
-            "resolution": self.controls.res_box.currentText(),
-            "aspect_ratio": self.controls.ar_box.currentText(),
-            "processor": self.controls.proc_box.currentText(),
-            "duration": self.dur_input.value(),
-            "spectrum": self.spectrum_chk.isChecked(),
             "spectrum_color": self.spectrum_color.name(),
-            "spectrum_style": self.spec_style_box.currentText(),
-            "spectrum_size": self.spec_size_slider.value(),
-            "spectrum_pos": self.spec_pos_box.currentText(),
-            "spectrum_thickness": self.spec_thick_slider.value(),
-            "spectrum_smoothness": self.spec_smooth_slider.value(),
-            "spectrum_sensitivity": self.spec_sens_slider.value(),
             "spectrum_custom_pos": self.preview_area.spectrum_rel_pos,
-            "text": self.text_input.text(),
             "text_color": self.text_color.name(),
-            "font": self.font_box.currentText(),
-            "text_shadow": self.text_shadow_chk.isChecked(),
-            "text_border_enabled": self.text_border_chk.isChecked(),
             "text_border_color": self.text_border_color.name(),
-            "text_border_width": self.text_border_width.value(),
-            "font_size": self.font_size_slider.value(),
-            "text_pos": self.text_pos_box.currentText(),
             "custom_pos": self.preview_area.rel_pos,
             "lyrics_path": self.lyrics_path,
             "lyrics_paths": self.lyrics_paths,
-            "lyrics_font": self.lyrics_font_box.currentText(),
-            "lyrics_fontsize": self.lyrics_size_slider.value(),
             "lyrics_color": self.lyrics_color.name(),
-            "lyrics_pos": self.lyrics_pos_box.currentText(),
             "lyrics_custom_pos": self.preview_area.lyrics_rel_pos,
-            "lyrics_bounce": self.lyrics_bounce_chk.isChecked(),
-            "lyrics_karaoke": self.lyrics_karaoke_chk.isChecked(),
-            "lyrics_scrolling": self.lyrics_scroll_chk.isChecked(),
-            "lyrics_bg_dim": self.lyrics_dim_chk.isChecked(),
-            "lyrics_box_enabled": self.lyrics_box_chk.isChecked(),
             "lyrics_box_color": [self.lyrics_box_color.red(), self.lyrics_box_color.green(), self.lyrics_box_color.blue(), self.lyrics_box_opacity_slider.value()],
             "logo_path": self.logo_path,
-            "logo_size": self.logo_size_slider.value(),
-            "logo_pos": self.logo_pos_box.currentText(),
-            "progressbar_enabled": self.prog_chk.isChecked(),
             "progressbar_color": [self.prog_color.red(), self.prog_color.green(), self.prog_color.blue()],
-            "progressbar_height": self.prog_height_slider.value(),
-            "progressbar_pos": self.prog_pos_box.currentText()
-        }
+        })
         
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=4)
+        write_json(path, data, indent=True)
         self.statusBar().showMessage(f"Preset saved: {os.path.basename(path)}", 5000)
 
     def load_preset(self):
@@ -1559,98 +2249,70 @@ class MainWindow(QMainWindow):
         if not path: return
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
+            data = read_json(path)
+            candidates = [data.get(k) for k in ("video_path", "audio_path", "lyrics_path", "logo_path")]
+            candidates += (data.get("audio_paths") or []) + (data.get("lyrics_paths") or [])
+            present = existing_paths(candidates)
             
-            if data.get("video_path") and os.path.exists(data["video_path"]):
+            if data.get("video_path") in present:
                 self.controls.img_btn.set_file(data["video_path"])
             
             if data.get("audio_paths"):
                 self.controls.clear_audio_list()
                 for path in data["audio_paths"]:
-                    if os.path.exists(path):
+                    if path in present:
                         self.controls.audio_btn.set_file(path)
-            elif data.get("audio_path") and os.path.exists(data["audio_path"]):
+            elif data.get("audio_path") in present:
                 self.controls.clear_audio_list()
                 self.controls.audio_btn.set_file(data["audio_path"])
                 
-            self.controls.res_box.setCurrentText(data.get("resolution", "1080p"))
-            self.controls.ar_box.setCurrentText(data.get("aspect_ratio", "16:9"))
-            self.controls.proc_box.setCurrentText(data.get("processor", "CPU"))
-            self.dur_input.setValue(data.get("duration", 3))
-            self.spectrum_chk.setChecked(data.get("spectrum", False))
+            for k, _, put, default in self._preset_fields:
+                put(data.get(k, default))
+
             if data.get("spectrum_color"):
                 self.spectrum_color = QColor(data["spectrum_color"])
-                self.color_btn.setStyleSheet(f"background-color: {self.spectrum_color.name()}; color: #000;")
-            self.spec_style_box.setCurrentText(data.get("spectrum_style", "Bars"))
-            self.spec_size_slider.setValue(data.get("spectrum_size", 50))
-            self.spec_thick_slider.setValue(data.get("spectrum_thickness", 80))
-            self.spec_smooth_slider.setValue(data.get("spectrum_smoothness", 0))
-            self.spec_sens_slider.setValue(data.get("spectrum_sensitivity", 100))
-            self.spec_pos_box.setCurrentText(data.get("spectrum_pos", "Bottom"))
+                self.set_button_color(self.color_btn, self.spectrum_color)
             if data.get("spectrum_custom_pos"): self.preview_area.spectrum_rel_pos = data["spectrum_custom_pos"]
-            self.text_input.setText(data.get("text", ""))
             if data.get("text_color"):
                 self.text_color = QColor(data["text_color"])
-                self.text_color_btn.setStyleSheet(f"background-color: {self.text_color.name()}; color: #000;")
-            self.text_shadow_chk.setChecked(data.get("text_shadow", False))
-            self.text_border_chk.setChecked(data.get("text_border_enabled", False))
+                self.set_button_color(self.text_color_btn, self.text_color)
             if data.get("text_border_color"):
                 self.text_border_color = QColor(data["text_border_color"])
-                self.text_border_color_btn.setStyleSheet(f"background-color: {self.text_border_color.name()}; color: #fff;")
-            self.text_border_width.setValue(data.get("text_border_width", 2))
-            self.font_box.setCurrentText(data.get("font", "Arial"))
-            self.font_size_slider.setValue(data.get("font_size", 70))
-            self.text_pos_box.setCurrentText(data.get("text_pos", "Center"))
+                self.set_button_color(self.text_border_color_btn, self.text_border_color, "#fff")
             if data.get("custom_pos"): self.preview_area.rel_pos = data["custom_pos"]
             
             if data.get("lyrics_paths"):
                 self.lyrics_list.clear()
                 self.lyrics_paths = []
                 for p in data["lyrics_paths"]:
-                    if os.path.exists(p):
+                    if p in present:
                         self.lyrics_paths.append(p)
-                        item = QListWidgetItem(os.path.basename(p))
-                        item.setData(Qt.UserRole, p)
-                        self.lyrics_list.addItem(item)
-            elif data.get("lyrics_path") and os.path.exists(data["lyrics_path"]):
+                        self._add_lyrics_item(p)
+            elif data.get("lyrics_path") in present:
                 self.lyrics_list.clear()
                 self.lyrics_path = data["lyrics_path"]
                 self.lyrics_paths = [self.lyrics_path]
-                item = QListWidgetItem(os.path.basename(self.lyrics_path))
-                item.setData(Qt.UserRole, self.lyrics_path)
-                self.lyrics_list.addItem(item)
+                self._add_lyrics_item(self.lyrics_path)
+            self._lyrics_paths_set = set(self.lyrics_paths)
+            self.preload_lyrics(self.lyrics_paths)
 
-            self.lyrics_font_box.setCurrentText(data.get("lyrics_font", "Arial"))
-            self.lyrics_size_slider.setValue(data.get("lyrics_fontsize", 50))
             if data.get("lyrics_color"):
                 self.lyrics_color = QColor(data["lyrics_color"])
-                self.lyrics_color_btn.setStyleSheet(f"background-color: {self.lyrics_color.name()}; color: #000;")
-            self.lyrics_pos_box.setCurrentText(data.get("lyrics_pos", "Bottom"))
+                self.set_button_color(self.lyrics_color_btn, self.lyrics_color)
             if data.get("lyrics_custom_pos"): self.preview_area.lyrics_rel_pos = data["lyrics_custom_pos"]
-            self.lyrics_bounce_chk.setChecked(data.get("lyrics_bounce", False))
-            self.lyrics_karaoke_chk.setChecked(data.get("lyrics_karaoke", False))
-            self.lyrics_scroll_chk.setChecked(data.get("lyrics_scrolling", False))
-            self.lyrics_dim_chk.setChecked(data.get("lyrics_bg_dim", False))
-            self.lyrics_box_chk.setChecked(data.get("lyrics_box_enabled", False))
             if data.get("lyrics_box_color"):
                 c = data["lyrics_box_color"]
                 self.lyrics_box_color = QColor(c[0], c[1], c[2], c[3])
                 self.lyrics_box_opacity_slider.setValue(c[3])
-                self.lyrics_box_color_btn.setStyleSheet(f"background-color: {self.lyrics_box_color.name()}; color: #fff;")
+                self.set_button_color(self.lyrics_box_color_btn, self.lyrics_box_color, "#fff")
 
-            if data.get("logo_path") and os.path.exists(data["logo_path"]):
+            if data.get("logo_path") in present:
                 self.logo_path = data["logo_path"]
                 self.logo_btn.setText(f"Logo: {os.path.basename(self.logo_path)}")
-            self.logo_size_slider.setValue(data.get("logo_size", 15))
-            self.logo_pos_box.setCurrentText(data.get("logo_pos", "Top Right"))
             
-            self.prog_chk.setChecked(data.get("progressbar_enabled", False))
             if data.get("progressbar_color"):
                 self.prog_color = QColor(data["progressbar_color"][0], data["progressbar_color"][1], data["progressbar_color"][2]) if isinstance(data["progressbar_color"], list) else QColor(data["progressbar_color"])
-                self.prog_color_btn.setStyleSheet(f"background-color: {self.prog_color.name()}; color: #000;")
-            self.prog_height_slider.setValue(data.get("progressbar_height", 2))
-            self.prog_pos_box.setCurrentText(data.get("progressbar_pos", "Bottom"))
+                self.set_button_color(self.prog_color_btn, self.prog_color)
             
             self.update_spectrum_preview()
             self.apply_logo_preview()
@@ -1678,7 +2340,7 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            expiry_date = datetime.datetime.strptime(expiry_date_str, "%Y%m%d").date()
+            expiry_date = parse_expiry(expiry_date_str).date()
             today = datetime.date.today()
             remaining_days = (expiry_date - today).days
 
@@ -1705,63 +2367,31 @@ class MainWindow(QMainWindow):
             return
         self.current_output_path = out_path
 
-        text_pos = self.text_pos_box.currentText()
-        if text_pos == "Custom":
-            text_pos = self.preview_area.rel_pos
-            
-        spec_pos = self.spec_pos_box.currentText()
-        if spec_pos == "Custom":
-            spec_pos = self.preview_area.spectrum_rel_pos
-            
-        lyrics_pos = self.lyrics_pos_box.currentText()
-        if lyrics_pos == "Custom":
-            lyrics_pos = self.preview_area.lyrics_rel_pos
-            
-        config = {
+        # Widget-backed settings share the preset field table; only renamed/derived keys differ
+        config = self.widget_values()
+        config["res"] = config.pop("resolution")
+        config["fontsize"] = config.pop("font_size")
+        config["duration"] *= 60
+        if config["text_pos"] == "Custom":
+            config["text_pos"] = self.preview_area.rel_pos
+        if config["spectrum_pos"] == "Custom":
+            config["spectrum_pos"] = self.preview_area.spectrum_rel_pos
+        if config["lyrics_pos"] == "Custom":
+            config["lyrics_pos"] = self.preview_area.lyrics_rel_pos
+        config.update({
             "video": self.controls.video_path,
             "audio": self.controls.audio_paths,
-            "res": self.controls.res_box.currentText(),
-            "aspect_ratio": self.controls.ar_box.currentText(),
-            "processor": self.controls.proc_box.currentText(),
-            "duration": self.dur_input.value() * 60,
-            "spectrum": self.spectrum_chk.isChecked(),
-            "spectrum_style": self.spec_style_box.currentText(),
-            "spectrum_size": self.spec_size_slider.value(),
-            "spectrum_thickness": self.spec_thick_slider.value(),
-            "spectrum_smoothness": self.spec_smooth_slider.value(),
-            "spectrum_sensitivity": self.spec_sens_slider.value(),
-            "spectrum_pos": spec_pos,
             "color": [self.spectrum_color.red(), self.spectrum_color.green(), self.spectrum_color.blue()],
-            "text": self.text_input.text(),
             "text_color": self.text_color.name(),
-            "font": self.font_box.currentText(),
-            "text_shadow": self.text_shadow_chk.isChecked(),
-            "text_border_enabled": self.text_border_chk.isChecked(),
             "text_border_color": self.text_border_color.name(),
-            "text_border_width": self.text_border_width.value(),
-            "fontsize": self.font_size_slider.value(),
-            "text_pos": text_pos,
             "lyrics_file": self.lyrics_path,
             "lyrics_files": self.lyrics_paths,
-            "lyrics_font": self.lyrics_font_box.currentText(),
-            "lyrics_fontsize": self.lyrics_size_slider.value(),
             "lyrics_color": self.lyrics_color.name(),
-            "lyrics_pos": lyrics_pos,
-            "lyrics_bounce": self.lyrics_bounce_chk.isChecked(),
-            "lyrics_karaoke": self.lyrics_karaoke_chk.isChecked(),
-            "lyrics_scrolling": self.lyrics_scroll_chk.isChecked(),
-            "lyrics_bg_dim": self.lyrics_dim_chk.isChecked(),
-            "lyrics_box_enabled": self.lyrics_box_chk.isChecked(),
             "lyrics_box_color": [self.lyrics_box_color.red(), self.lyrics_box_color.green(), self.lyrics_box_color.blue(), self.lyrics_box_opacity_slider.value()],
             "logo": self.logo_path,
-            "logo_size": self.logo_size_slider.value(),
-            "logo_pos": self.logo_pos_box.currentText(),
-            "progressbar_enabled": self.prog_chk.isChecked(),
             "progressbar_color": [self.prog_color.red(), self.prog_color.green(), self.prog_color.blue()],
-            "progressbar_height": self.prog_height_slider.value(),
-            "progressbar_pos": self.prog_pos_box.currentText(),
             "out": out_path
-        }
+        })
         self.worker = Worker(config)
         self.worker.error.connect(self.handle_error)
         self.worker.progress.connect(self.pbar.setValue)
@@ -1804,12 +2434,21 @@ class MainWindow(QMainWindow):
 
             if reply == QMessageBox.Yes:
                 self.worker.requestInterruption()
+                self.stop_audio_thread()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.stop_audio_thread()
             event.accept()
 
+    def stop_audio_thread(self):
+        # Reached from closeEvent and again from aboutToQuit; the second call is a no-op
+        self.cancel_spectrum()
+        if not self.audio_thread.isRunning(): return
+        self.audio_thread.quit()
+        self.audio_thread.wait()
+
 DARK_STYLESHEET = """
 QMainWindow, QWidget {
     background-color: #2b2b2b;
@@ -1914,13 +2553,11 @@ if __name__ == "__main__":
         try:
             if "-" in saved_key:
                 exp_str, key_part = saved_key.split('-')
-                data_hash = f"{device_id}|{exp_str}|{SECRET_SALT}"
-                expected = hashlib.sha256(data_hash.encode()).hexdigest()[:16].upper()
                 
-                if key_part == expected:
+                if license_key_matches(device_id, exp_str, key_part):
                     is_expired = False
                     if exp_str != "99991231":
-                        exp_date = datetime.datetime.strptime(exp_str, "%Y%m%d")
+                        exp_date = parse_expiry(exp_str)
                         now = datetime.datetime.now()
                         if now > exp_date:
                             is_expired = True
@@ -0,0 +1,31 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lyrics import read_lyrics_file
+
+
+class ReadLyricsFileTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.lrc')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write("[ar:Someone]\n[00:01.00]first\n[00:05.50]second\n")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_last_cue_defaults_to_ten_seconds(self):
+        cues = read_lyrics_file(self.path)
+        self.assertEqual(cues, [((1.0, 5.5), "first"), ((5.5, 15.5), "second")])
+
+    def test_last_cue_ends_at_last_end(self):
+        # The renderer passes the video length so the final line stays up until the end
+        cues = read_lyrics_file(self.path, last_end=180.0)
+        self.assertEqual(cues[-1], ((5.5, 180.0), "second"))
+
+
+if __name__ == '__main__':
+    unittest.main()